@@ -3,12 +3,190 @@ AI Suggestions Module for Resume Generator
 Provides AI-powered suggestions for resume content
 """
 
+import asyncio
+import os
 import requests
 import json
 import random
+import re
+import threading
+import time
 
-# Default URL for Ollama API
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Try to import optional dependencies for the semantic cache
+try:
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+    SEMANTIC_CACHE_AVAILABLE = True
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+# Try to import aiohttp for concurrent suggestion fan-out
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# Try to import orjson for faster parsing of streamed response chunks
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_loads(data):
+    """Decode JSON with orjson when available, stdlib json otherwise"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Default URL and model for the Ollama API
 OLLAMA_API_URL = "http://localhost:11434/api/generate"
+OLLAMA_MODEL = "qwen2.5:3b"
+
+# Matches the {placeholder} slots in the experience templates
+_PLACEHOLDER_RE = re.compile(r'\{(technology|number|percentage|metric)\}')
+
+# Value pools for the experience-template placeholders, built once at import
+_TECHNOLOGIES = ("web", "mobile", "cloud", "desktop")
+_METRICS = ("accuracy", "efficiency", "sales", "retention")
+_NUMBERS = range(100, 10001)
+_PERCENTAGES = range(15, 51)
+
+# Matches one numbered ("1." / "1)") or dashed bullet line in a model response
+_BULLET_RE = re.compile(r'(?m)^\s*(?:\d+[.)]\s*|-\s*)(.+?)\s*$')
+
+class OllamaClient:
+    """
+    Supervisor for Ollama HTTP traffic: owns the pooled keep-alive session
+    and a circuit breaker so a dead server short-circuits to the fallback
+    tables instead of stacking full connect timeouts on every call.
+    """
+
+    def __init__(self, base_url=OLLAMA_API_URL, pool_size=16, timeout=10,
+                 fail_max=3, reset_timeout=30, probe_interval=60):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.probe_interval = probe_interval
+        self._failures = 0
+        self._opened_at = 0.0
+        self._available = None
+        self._probed_at = 0.0
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_size,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        ))
+
+    def available(self):
+        """
+        Whether an Ollama server is reachable, probed with a fast /api/tags
+        request and cached for probe_interval seconds. Keeps the worst case
+        for a missing server at one sub-second probe per interval instead of
+        a full generation timeout per suggestion call.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._available is not None and now - self._probed_at < self.probe_interval:
+                return self._available
+
+        try:
+            base = self.base_url.rsplit("/api/", 1)[0]
+            reachable = self.session.get(f"{base}/api/tags", timeout=0.5).status_code == 200
+        except requests.RequestException:
+            reachable = False
+
+        with self._lock:
+            self._available = reachable
+            self._probed_at = now
+        return reachable
+
+    def _allow_request(self):
+        """Whether the breaker currently lets a request through"""
+        with self._lock:
+            if self._failures < self.fail_max:
+                return True
+            if time.monotonic() - self._opened_at >= self.reset_timeout:
+                # Half-open: let one probe request test the server again
+                self._failures = self.fail_max - 1
+                return True
+            return False
+
+    def _record_success(self):
+        with self._lock:
+            self._failures = 0
+
+    def _record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+
+    def generate(self, prompt, response_format=None, timeout=None):
+        """
+        Generate text for a prompt, streaming the response chunks.
+
+        Args:
+            prompt: The prompt to send to Ollama
+            response_format: Optional Ollama format constraint (e.g. "json")
+            timeout: Optional timeout in seconds overriding the client default
+
+        Returns:
+            str: The generated text, or None if the breaker is open or the
+                 request failed
+        """
+        if not self._allow_request() or not self.available():
+            return None
+
+        payload = {
+            "model": OLLAMA_MODEL,
+            "prompt": prompt,
+            "stream": True
+        }
+        if response_format:
+            payload["format"] = response_format
+
+        try:
+            response = self.session.post(self.base_url, json=payload,
+                                         timeout=timeout if timeout is not None else self.timeout,
+                                         stream=True)
+
+            if response.status_code != 200:
+                response.close()
+                self._record_failure()
+                return None
+
+            # Accumulate the NDJSON stream chunk by chunk; tokens arrive as
+            # they are generated and the connection can be dropped early if
+            # the model keeps going after signalling done
+            chunks = []
+            try:
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _json_loads(line)
+                    chunks.append(chunk.get("response", ""))
+                    if chunk.get("done"):
+                        break
+            finally:
+                response.close()
+
+            self._record_success()
+            return "".join(chunks)
+        except (requests.RequestException, ValueError):
+            self._record_failure()
+            return None
+
+# Module-level client shared by every suggestion helper
+_CLIENT = OllamaClient()
 
 # Hardcoded skill suggestions by role (fallback when Ollama is not available)
 SKILL_SUGGESTIONS = {
@@ -99,56 +277,105 @@ EXPERIENCE_SUGGESTIONS = {
     ]
 }
 
-def get_skill_suggestions(job_role):
+# Freeze the fallback tables as tuples once at import so per-call sampling
+# works on immutable, shareable sequences
+SKILL_SUGGESTIONS = {role: tuple(skills) for role, skills in SKILL_SUGGESTIONS.items()}
+SUMMARY_SUGGESTIONS = {role: tuple(summaries) for role, summaries in SUMMARY_SUGGESTIONS.items()}
+EXPERIENCE_SUGGESTIONS = {role: tuple(templates) for role, templates in EXPERIENCE_SUGGESTIONS.items()}
+
+def _closest_role(job_role, table, default="software developer"):
+    """
+    Find the suggestion-table key that best matches a normalized job role.
+    Exact matches resolve with a single dict lookup; only unknown roles pay
+    for the substring scan over the table keys.
+
+    Args:
+        job_role: Normalized (lowercased) job role
+        table: Suggestion dict keyed by role name
+        default: Key to return when nothing matches
+
+    Returns:
+        str: The matching table key
+    """
+    if job_role in table:
+        return job_role
+
+    for role in table:
+        if role in job_role or job_role in role:
+            return role
+
+    return default
+
+def _build_skill_prompt(job_role):
+    """Build the Ollama prompt for skill suggestions"""
+    return (f"List 10 important professional skills for a {job_role} role. " +
+            "Provide a comma-separated list of technical and soft skills.")
+
+def _build_summary_prompt(job_role, years_experience=None):
+    """Build the Ollama prompt for a professional summary"""
+    experience_text = f" with {years_experience} years of experience" if years_experience else ""
+    return (f"Write a concise, powerful professional summary for a {job_role}{experience_text}. " +
+            "Keep it to 2-3 sentences highlighting key strengths.")
+
+def _build_bullet_prompt(job_role, company=None, count=3):
+    """Build the Ollama prompt for experience bullet points"""
+    company_text = f" at {company}" if company else ""
+    return (f"Generate {count} concise, achievement-oriented bullet points for a resume " +
+            f"for a {job_role}{company_text} position. Include concrete metrics and achievements " +
+            "where possible. Format as a numbered list.")
+
+def _parse_skill_list(ai_suggestions):
+    """Parse a comma-separated skill list from an Ollama response"""
+    skills = [s.strip() for s in ai_suggestions.split(',')]
+    # Remove any empty items and limit to 15 skills
+    return [s for s in skills if s][:15]
+
+def _parse_bullet_list(ai_suggestion, count):
+    """Parse a numbered or dashed list of bullet points from an Ollama response"""
+    return _BULLET_RE.findall(ai_suggestion)[:count]
+
+def get_skill_suggestions(job_role, timeout=None):
     """
     Get skill suggestions based on job role.
     Falls back to hardcoded suggestions if Ollama is not available.
     
     Args:
         job_role: The job role to get skills for
+        timeout: Optional per-call Ollama timeout in seconds
     
     Returns:
         list: List of suggested skills
     """
     # Normalize job role to match our keys
     job_role = job_role.lower()
-    
+
     # Find the closest match in our hardcoded skills
-    closest_role = "software developer"  # Default role
-    for role in SKILL_SUGGESTIONS:
-        if role in job_role or job_role in role:
-            closest_role = role
-            break
-    
+    closest_role = _closest_role(job_role, SKILL_SUGGESTIONS)
+
     # Try to get suggestions from Ollama first
     try:
-        ai_suggestions = get_suggestions_from_ollama(
-            f"List 10 important professional skills for a {job_role} role. " +
-            "Provide a comma-separated list of technical and soft skills."
-        )
-        
+        ai_suggestions = get_suggestions_from_ollama(_build_skill_prompt(job_role), timeout=timeout)
+
         if ai_suggestions:
-            # Parse the comma-separated list
-            skills = [s.strip() for s in ai_suggestions.split(',')]
-            # Remove any empty items
-            skills = [s for s in skills if s]
-            # Limit to 15 skills
-            return skills[:15]
-    except:
+            skills = _parse_skill_list(ai_suggestions)
+            if skills:
+                return skills
+    except (requests.RequestException, ValueError, KeyError):
         # If Ollama fails, fall back to hardcoded suggestions
         pass
     
     # Use our hardcoded fallback
-    return random.sample(SKILL_SUGGESTIONS.get(closest_role, SKILL_SUGGESTIONS["software developer"]), 
-                         min(12, len(SKILL_SUGGESTIONS.get(closest_role, SKILL_SUGGESTIONS["software developer"]))))
+    pool = SKILL_SUGGESTIONS[closest_role]
+    return random.sample(pool, min(12, len(pool)))
 
-def get_summary_suggestion(job_role, years_experience=None):
+def get_summary_suggestion(job_role, years_experience=None, timeout=None):
     """
     Get a summary suggestion based on job role and experience.
     
     Args:
         job_role: The job role
         years_experience: Optional years of experience
+        timeout: Optional per-call Ollama timeout in seconds
     
     Returns:
         str: A suggested summary
@@ -157,29 +384,21 @@ def get_summary_suggestion(job_role, years_experience=None):
     job_role = job_role.lower()
     
     # Try to get suggestions from Ollama first
-    experience_text = f" with {years_experience} years of experience" if years_experience else ""
     try:
-        ai_suggestion = get_suggestions_from_ollama(
-            f"Write a concise, powerful professional summary for a {job_role}{experience_text}. " +
-            "Keep it to 2-3 sentences highlighting key strengths."
-        )
-        
+        ai_suggestion = get_suggestions_from_ollama(_build_summary_prompt(job_role, years_experience), timeout=timeout)
+
         if ai_suggestion:
             return ai_suggestion
-    except:
+    except (requests.RequestException, ValueError, KeyError):
         # If Ollama fails, fall back to hardcoded suggestions
         pass
     
     # Find the closest match in our hardcoded summaries
-    for role in SUMMARY_SUGGESTIONS:
-        if role in job_role:
-            summaries = SUMMARY_SUGGESTIONS[role]
-            return random.choice(summaries)
-    
-    # Default to software developer if no match
-    return random.choice(SUMMARY_SUGGESTIONS["software developer"])
+    # (defaults to software developer if no match)
+    summaries = SUMMARY_SUGGESTIONS[_closest_role(job_role, SUMMARY_SUGGESTIONS)]
+    return random.choice(summaries)
 
-def get_experience_bullet_points(job_role, company=None, count=3):
+def get_experience_bullet_points(job_role, company=None, count=3, timeout=None):
     """
     Get experience bullet point suggestions.
     
@@ -187,6 +406,7 @@ def get_experience_bullet_points(job_role, company=None, count=3):
         job_role: The job role
         company: Optional company name to include
         count: Number of bullet points to generate
+        timeout: Optional per-call Ollama timeout in seconds
     
     Returns:
         list: List of bullet point suggestions
@@ -195,88 +415,332 @@ def get_experience_bullet_points(job_role, company=None, count=3):
     job_role = job_role.lower()
     
     # Try to get suggestions from Ollama first
-    company_text = f" at {company}" if company else ""
     try:
-        ai_suggestion = get_suggestions_from_ollama(
-            f"Generate {count} concise, achievement-oriented bullet points for a resume " +
-            f"for a {job_role}{company_text} position. Include concrete metrics and achievements " +
-            "where possible. Format as a numbered list."
-        )
-        
+        ai_suggestion = get_suggestions_from_ollama(_build_bullet_prompt(job_role, company, count), timeout=timeout)
+
         if ai_suggestion:
-            # Parse the numbered list
-            bullet_points = []
-            for line in ai_suggestion.split("\n"):
-                line = line.strip()
-                if line and (line[0].isdigit() or line[0] == '-'):
-                    bullet_points.append(line[2:].strip() if line[0].isdigit() else line[1:].strip())
-            
+            bullet_points = _parse_bullet_list(ai_suggestion, count)
             if bullet_points:
-                return bullet_points[:count]
-    except:
+                return bullet_points
+    except (requests.RequestException, ValueError, KeyError):
         # If Ollama fails, fall back to hardcoded suggestions
         pass
     
     # Find templates for the closest role
-    templates = []
-    for role in EXPERIENCE_SUGGESTIONS:
-        if role in job_role:
-            templates = EXPERIENCE_SUGGESTIONS[role]
-            break
-    
-    # Default to software developer if no match
-    if not templates:
-        templates = EXPERIENCE_SUGGESTIONS["software developer"]
+    # (defaults to software developer if no match)
+    templates = EXPERIENCE_SUGGESTIONS[_closest_role(job_role, EXPERIENCE_SUGGESTIONS)]
     
-    # Generate bullet points from templates
-    bullet_points = []
+    # Pick templates for every bullet up front, topping up from the default
+    # role's templates when the matched role has fewer than count
     sampled_templates = random.sample(templates, min(count, len(templates)))
-    
-    for template in sampled_templates:
-        # Replace placeholders with random values
-        bullet = template.replace("{technology}", random.choice(["web", "mobile", "cloud", "desktop"]))
-        bullet = bullet.replace("{number}", str(random.randint(100, 10000)))
-        bullet = bullet.replace("{percentage}", str(random.randint(15, 50)))
-        bullet = bullet.replace("{metric}", random.choice(["accuracy", "efficiency", "sales", "retention"]))
-        bullet_points.append(bullet)
-    
-    # Fill up to count if needed
-    while len(bullet_points) < count:
-        bullet_points.append(random.choice(EXPERIENCE_SUGGESTIONS["software developer"]).replace(
-            "{technology}", random.choice(["web", "mobile", "cloud", "desktop"])
-        ).replace(
-            "{number}", str(random.randint(100, 10000))
-        ).replace(
-            "{percentage}", str(random.randint(15, 50))
-        ).replace(
-            "{metric}", random.choice(["accuracy", "efficiency", "sales", "retention"]))
+    if len(sampled_templates) < count:
+        sampled_templates += random.choices(
+            EXPERIENCE_SUGGESTIONS["software developer"],
+            k=count - len(sampled_templates)
         )
-    
+
+    # Draw all placeholder values in one batch per placeholder kind
+    technologies = random.choices(_TECHNOLOGIES, k=count)
+    numbers = random.choices(_NUMBERS, k=count)
+    percentages = random.choices(_PERCENTAGES, k=count)
+    metrics = random.choices(_METRICS, k=count)
+
+    bullet_points = []
+    for i, template in enumerate(sampled_templates):
+        # Substitute every placeholder in one scan of the template
+        values = {
+            "technology": technologies[i],
+            "number": str(numbers[i]),
+            "percentage": str(percentages[i]),
+            "metric": metrics[i]
+        }
+        bullet_points.append(_PLACEHOLDER_RE.sub(lambda m: values[m.group(1)], template))
+
     return bullet_points
 
-def get_suggestions_from_ollama(prompt):
+# Semantic cache settings: prompts whose embeddings are this similar share a response
+SEMANTIC_CACHE_THRESHOLD = 0.92
+SEMANTIC_CACHE_MAX_ENTRIES = 128
+SEMANTIC_CACHE_TTL = 3600  # seconds
+
+# In-memory semantic cache: list of (embedding, response, timestamp)
+_SEMANTIC_CACHE = []
+_EMBEDDER = None
+
+# Exact-prompt LRU cache: the suggestion helpers build deterministic prompts
+# from a small set of job roles, so repeat prompts are common
+PROMPT_CACHE_MAX_ENTRIES = 512
+_PROMPT_CACHE = {}
+_PROMPT_CACHE_LOCK = threading.Lock()
+
+def _prompt_cache_lookup(prompt):
+    """Return the cached response for an exact prompt, or None on a miss"""
+    with _PROMPT_CACHE_LOCK:
+        if prompt in _PROMPT_CACHE:
+            # Re-insert to mark as most recently used
+            response = _PROMPT_CACHE.pop(prompt)
+            _PROMPT_CACHE[prompt] = response
+            return response
+    return None
+
+def _prompt_cache_store(prompt, response):
+    """Cache a successful response, evicting the least recently used entry"""
+    with _PROMPT_CACHE_LOCK:
+        if len(_PROMPT_CACHE) >= PROMPT_CACHE_MAX_ENTRIES:
+            _PROMPT_CACHE.pop(next(iter(_PROMPT_CACHE)))
+        _PROMPT_CACHE[prompt] = response
+
+def _get_embedder():
+    """Load the sentence embedding model once and reuse it"""
+    global _EMBEDDER
+    if _EMBEDDER is None:
+        _EMBEDDER = SentenceTransformer("all-MiniLM-L6-v2")
+    return _EMBEDDER
+
+def _embed_prompt(prompt):
+    """Embed a prompt as a normalized float32 vector"""
+    return _get_embedder().encode(prompt, normalize_embeddings=True).astype(np.float32)
+
+def _semantic_cache_lookup(embedding):
     """
-    Get suggestions from Ollama API
-    
+    Look up a cached response whose prompt embedding is close enough
+
+    Args:
+        embedding: Normalized embedding of the incoming prompt
+
+    Returns:
+        str: The cached response or None if no close match
+    """
+    # Drop expired entries first
+    now = time.time()
+    _SEMANTIC_CACHE[:] = [entry for entry in _SEMANTIC_CACHE
+                          if now - entry[2] < SEMANTIC_CACHE_TTL]
+
+    if not _SEMANTIC_CACHE:
+        return None
+
+    # One matrix-vector product against all cached embeddings
+    matrix = np.stack([entry[0] for entry in _SEMANTIC_CACHE])
+    similarities = matrix @ embedding
+    best = int(similarities.argmax())
+
+    if similarities[best] > SEMANTIC_CACHE_THRESHOLD:
+        # Refresh the entry so frequently-hit prompts stay cached
+        hit = _SEMANTIC_CACHE.pop(best)
+        _SEMANTIC_CACHE.append(hit)
+        return hit[1]
+
+    return None
+
+def _semantic_cache_store(embedding, response):
+    """Store a response in the semantic cache, evicting the oldest entry if full"""
+    if len(_SEMANTIC_CACHE) >= SEMANTIC_CACHE_MAX_ENTRIES:
+        _SEMANTIC_CACHE.pop(0)
+    _SEMANTIC_CACHE.append((embedding, response, time.time()))
+
+def get_all_suggestions(job_role, years_experience=None, company=None, count=3, deadline=None):
+    """
+    Get skills, summary, and experience bullet points in one Ollama request.
+    Batching the three prompts into a single generation removes two of the
+    three network round trips on the full-resume path.
+
+    Args:
+        job_role: The job role
+        years_experience: Optional years of experience for the summary
+        company: Optional company name for the bullet points
+        count: Number of bullet points to generate
+        deadline: Optional overall latency budget in seconds, shared between
+                  the batched call and any per-field fallback calls
+
+    Returns:
+        dict: {'skills': list, 'summary': str, 'bullets': list}
+    """
+    started = time.monotonic()
+    job_role = job_role.lower()
+    experience_text = f" with {years_experience} years of experience" if years_experience else ""
+    company_text = f" at {company}" if company else ""
+
+    try:
+        prompt = (
+            f"Provide resume suggestions for a {job_role}{experience_text}{company_text} position. "
+            "Respond with a JSON object containing exactly these keys: "
+            '"skills": a list of 10 important technical and soft skills, '
+            '"summary": a concise 2-3 sentence professional summary highlighting key strengths, '
+            f'"bullets": a list of {count} concise, achievement-oriented bullet points '
+            "with concrete metrics and achievements where possible."
+        )
+
+        raw = _CLIENT.generate(prompt, response_format="json", timeout=deadline)
+
+        if raw:
+            data = _json_loads(raw)
+
+            skills = [str(s).strip() for s in data.get("skills", []) if str(s).strip()]
+            summary = str(data.get("summary", "")).strip()
+            bullets = [str(b).strip() for b in data.get("bullets", []) if str(b).strip()]
+
+            if skills and summary and bullets:
+                return {
+                    "skills": skills[:15],
+                    "summary": summary,
+                    "bullets": bullets[:count]
+                }
+    except (requests.RequestException, ValueError, KeyError, TypeError):
+        # If the batched call fails, fall back to the individual helpers
+        pass
+
+    def remaining_budget(calls_left):
+        """Apportion what is left of the deadline across the remaining calls"""
+        if deadline is None:
+            return None
+        return max(0.5, (deadline - (time.monotonic() - started)) / calls_left)
+
+    return {
+        "skills": get_skill_suggestions(job_role, timeout=remaining_budget(3)),
+        "summary": get_summary_suggestion(job_role, years_experience,
+                                          timeout=remaining_budget(2)),
+        "bullets": get_experience_bullet_points(job_role, company, count,
+                                                timeout=remaining_budget(1))
+    }
+
+async def get_suggestions_from_ollama_async(prompt, session):
+    """
+    Async variant of get_suggestions_from_ollama using a shared aiohttp session
+
     Args:
         prompt: The prompt to send to Ollama
-    
+        session: An aiohttp.ClientSession to send the request through
+
     Returns:
         str: The generated text or None if failed
     """
+    cached = _prompt_cache_lookup(prompt)
+    if cached is not None:
+        return cached
+
     try:
         payload = {
-            "model": "qwen2.5:3b",
+            "model": OLLAMA_MODEL,
             "prompt": prompt,
             "stream": False
         }
-        
-        response = requests.post(OLLAMA_API_URL, json=payload, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            return data.get("response", "")
-        
+
+        async with session.post(OLLAMA_API_URL, json=payload,
+                                timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 200:
+                data = await response.json()
+                generated = data.get("response", "")
+                if generated:
+                    _prompt_cache_store(prompt, generated)
+                return generated
+
+        return None
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError, KeyError):
         return None
-    except:
-        return None 
\ No newline at end of file
+
+async def get_all_suggestions_async(job_role, years_experience=None, company=None, count=3):
+    """
+    Fetch skills, summary, and bullet points concurrently over one connection pool.
+    Wall-clock latency becomes the slowest of the three calls instead of their sum.
+
+    Args:
+        job_role: The job role
+        years_experience: Optional years of experience for the summary
+        company: Optional company name for the bullet points
+        count: Number of bullet points to generate
+
+    Returns:
+        dict: {'skills': list, 'summary': str, 'bullets': list}
+    """
+    job_role = job_role.lower()
+
+    connector = aiohttp.TCPConnector(limit=8, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        skills_text, summary_text, bullets_text = await asyncio.gather(
+            get_suggestions_from_ollama_async(_build_skill_prompt(job_role), session),
+            get_suggestions_from_ollama_async(_build_summary_prompt(job_role, years_experience), session),
+            get_suggestions_from_ollama_async(_build_bullet_prompt(job_role, company, count), session)
+        )
+
+    # Fall back to the synchronous helpers (and their hardcoded tables) per field
+    skills = _parse_skill_list(skills_text) if skills_text else []
+    bullets = _parse_bullet_list(bullets_text, count) if bullets_text else []
+
+    return {
+        "skills": skills or get_skill_suggestions(job_role),
+        "summary": summary_text or get_summary_suggestion(job_role, years_experience),
+        "bullets": bullets or get_experience_bullet_points(job_role, company, count)
+    }
+
+def get_all_suggestions_concurrent(job_role, years_experience=None, company=None, count=3):
+    """
+    Synchronous wrapper around get_all_suggestions_async for existing callers.
+    Falls back to the batched single-request path when aiohttp is not installed.
+    """
+    if not AIOHTTP_AVAILABLE:
+        return get_all_suggestions(job_role, years_experience, company, count)
+
+    return asyncio.run(get_all_suggestions_async(job_role, years_experience, company, count))
+
+def get_suggestions_from_ollama(prompt, timeout=None):
+    """
+    Get suggestions from Ollama API
+
+    Args:
+        prompt: The prompt to send to Ollama
+        timeout: Optional timeout in seconds (defaults to the client timeout)
+
+    Returns:
+        str: The generated text or None if failed
+    """
+    # Exact-prompt hits skip both embedding and generation entirely
+    cached = _prompt_cache_lookup(prompt)
+    if cached is not None:
+        return cached
+
+    # Check the semantic cache before paying for a full generation
+    embedding = None
+    if SEMANTIC_CACHE_AVAILABLE:
+        embedding = _embed_prompt(prompt)
+        cached = _semantic_cache_lookup(embedding)
+        if cached is not None:
+            return cached
+
+    generated = _CLIENT.generate(prompt, timeout=timeout)
+
+    if generated:
+        # Only cache successful generations so failures are retried
+        _prompt_cache_store(prompt, generated)
+        if embedding is not None:
+            _semantic_cache_store(embedding, generated)
+
+    return generated 
+def warmup(roles=None, count=3):
+    """
+    Prefetch suggestions for common job roles in a background thread so the
+    caches are warm by the time the user asks for their role.
+
+    Args:
+        roles: Roles to prefetch (defaults to the hardcoded suggestion roles)
+        count: Number of bullet points to prefetch per role
+
+    Returns:
+        threading.Thread: The daemon thread doing the prefetch
+    """
+    if roles is None:
+        roles = list(SKILL_SUGGESTIONS)
+
+    def _prefetch():
+        for role in roles:
+            get_skill_suggestions(role)
+            get_summary_suggestion(role)
+            get_experience_bullet_points(role, count=count)
+
+    thread = threading.Thread(target=_prefetch, daemon=True)
+    thread.start()
+    return thread
+
+# Opt-in import-time warmup so interactive use gets instant suggestions
+# without tests or scripts paying for background Ollama traffic
+if os.environ.get("AI_SUGGESTIONS_WARMUP") == "1":
+    warmup()
@@ -11,69 +11,100 @@ import json
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext, filedialog
 import threading
+import time
+import functools
+import bisect
+import difflib
+import hashlib
+import pickle
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import datetime
 import socket
 import re
 import random
+import string
 import webbrowser
 from tkinter import font as tkfont
 
-# Try to import optional modules
+import asyncio
+import importlib
+import importlib.util
+
+# Optional modules: presence is probed without importing; the import
+# itself happens at first use
+REQUESTS_AVAILABLE = importlib.util.find_spec("requests") is not None
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 try:
-    import requests
-    REQUESTS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    REQUESTS_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+def _json_dumps(obj):
+    """Serialize to compact JSON bytes, via orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, via orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 # Ollama API settings
 OLLAMA_API_URL = "http://localhost:11434/api/generate"
 OLLAMA_MODEL = "qwen2.5:3b"
 
-# Path for resume history
+# Path for resume history (legacy pretty-printed JSON and append-only JSONL)
 HISTORY_FILE = "resume_history.json"
+HISTORY_FILE_JSONL = "resume_history.jsonl"
 
-# Try to import our custom modules with graceful fallbacks
-try:
-    import resume_templates
-    TEMPLATES_AVAILABLE = True
-except ImportError:
-    TEMPLATES_AVAILABLE = False
-    print("Warning: resume_templates module not found. Basic templates will be used.")
+# Disk cache for parsed LinkedIn exports, keyed by content hash
+LINKEDIN_CACHE_DIR = Path("~/.srg_cache").expanduser()
 
-try:
-    import resume_export
-    EXPORT_AVAILABLE = True
-except ImportError:
-    EXPORT_AVAILABLE = False
-    print("Warning: resume_export module not found. Export functionality will be limited.")
+# ATS rating ladder, table-driven so thresholds are tunable in one place
+_ATS_THRESHOLDS = [50, 70, 85]
+_ATS_LABELS = ["Needs Improvement", "Average", "Good", "Excellent"]
 
-try:
-    import ai_suggestions
-    AI_SUGGESTIONS_AVAILABLE = True
-except ImportError:
-    AI_SUGGESTIONS_AVAILABLE = False
-    print("Warning: ai_suggestions module not found. AI suggestions will not be available.")
+# Our custom modules are loaded lazily: find_spec answers "is it there?"
+# without importing, and _lazy pulls the module (plus anything heavy it
+# drags in, like PIL or python-docx) only when a feature first needs it
+def _module_available(name, warning):
+    if importlib.util.find_spec(name) is not None:
+        return True
+    print(f"Warning: {name} module not found. {warning}")
+    return False
 
-try:
-    import text_enhancer
-    TEXT_ENHANCER_AVAILABLE = True
-except ImportError:
-    TEXT_ENHANCER_AVAILABLE = False
-    print("Warning: text_enhancer module not found. Text enhancement will not be available.")
+TEMPLATES_AVAILABLE = _module_available(
+    "resume_templates", "Basic templates will be used.")
+EXPORT_AVAILABLE = _module_available(
+    "resume_export", "Export functionality will be limited.")
+AI_SUGGESTIONS_AVAILABLE = _module_available(
+    "ai_suggestions", "AI suggestions will not be available.")
+TEXT_ENHANCER_AVAILABLE = _module_available(
+    "text_enhancer", "Text enhancement will not be available.")
+QR_AVAILABLE = _module_available(
+    "qr_generator", "QR code generation will not be available.")
+LINKEDIN_IMPORT_AVAILABLE = _module_available(
+    "linkedin_import", "LinkedIn import will not be available.")
 
-try:
-    import qr_generator
-    QR_AVAILABLE = True
-except ImportError:
-    QR_AVAILABLE = False
-    print("Warning: qr_generator module not found. QR code generation will not be available.")
+_LAZY_MODULES = {}
 
-try:
-    import linkedin_import
-    LINKEDIN_IMPORT_AVAILABLE = True
-except ImportError:
-    LINKEDIN_IMPORT_AVAILABLE = False
-    print("Warning: linkedin_import module not found. LinkedIn import will not be available.")
+def _lazy(name):
+    """Import a module on first use and cache it"""
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        module = importlib.import_module(name)
+        _LAZY_MODULES[name] = module
+    return module
 
 # Define basic templates in case resume_templates module is not available
 BASIC_TEMPLATES = {
@@ -130,106 +161,298 @@ Address: {location}
 """
 }
 
+# Markdown bits highlighted in the preview; ranges are computed in Python
+# and applied with one tag_add per tag rather than one per match
+_MD_BOLD_RE = re.compile(r'\*\*[^*\n]+\*\*')
+
+# AI prompt skeleton split once at import: even slots are literal fragments,
+# odd slots are filled per call, so building a prompt is one join with no
+# format-string parsing
+_AI_PROMPT_PARTS = (
+    "Create a professional resume for the following individual:\n\nName: ", None,
+    "\nJob Role: ", None,
+    "\nSkills: ", None,
+    "\nExperience: ", None,
+    "\nEducation: ", None,
+    "\nEmail: ", None,
+    "\nPhone: ", None,
+    "\nLocation: ", None,
+    "\nLinks: ", None,
+    "\n\nFormat the resume with markdown, using sections for Summary, Skills, "
+    "Experience, Education, and Contact Information.\n"
+    "Be concise, professional, and highlight key achievements. Write in third person.\n"
+)
+
+def _build_resume_prompt(name, job_role, skills, experience, education, email, phone, location, links):
+    """Fill the prompt skeleton's value slots and join in one pass"""
+    parts = list(_AI_PROMPT_PARTS)
+    parts[1::2] = (name, job_role, skills, experience, education, email, phone, location, links)
+    return "".join(parts)
+
+def _compile_template(name, template):
+    """
+    Compile a {field}-style template into a plain function.
+
+    The template is parsed exactly once here; the generated function is a
+    straight tuple-of-strings join with no format-string parsing per call.
+    """
+    parts = []
+    fields = []
+    for literal, field, _spec, _conv in string.Formatter().parse(template):
+        if literal:
+            parts.append(repr(literal))
+        if field is not None:
+            parts.append(field)
+            if field not in fields:
+                fields.append(field)
+    source = "def _fmt_{0}({1}):\n    return ''.join(({2},))".format(
+        name, ", ".join(fields), ", ".join(parts))
+    namespace = {}
+    exec(compile(source, f"<template:{name}>", "exec"), namespace)
+    return namespace[f"_fmt_{name}"]
+
+# Each basic template compiled once at import into a direct-concatenation
+# function; filling one is a single join over its argument values
+_COMPILED_TEMPLATES = {
+    name: _compile_template(name, template)
+    for name, template in BASIC_TEMPLATES.items()
+}
+
 class ModernWidget:
-    """Helper class to apply modern styling to tkinter widgets"""
-    @staticmethod
-    def style_frame(frame, bg="#f0f0f0", relief=tk.FLAT):
-        frame.configure(bg=bg, relief=relief)
-        return frame
-    
-    @staticmethod
-    def style_label(label, bg="#f0f0f0", fg="#333333", font=("Helvetica", 10)):
-        label.configure(bg=bg, fg=fg, font=font)
-        return label
-    
-    @staticmethod
-    def style_entry(entry, bg="#ffffff", fg="#333333", font=("Helvetica", 10)):
-        entry.configure(bg=bg, fg=fg, font=font, relief=tk.SOLID, bd=1)
-        return entry
-    
-    @staticmethod
-    def style_button(button, bg="#4a6fa5", fg="#ffffff", font=("Helvetica", 10, "bold"),
-                    activebackground="#3b5998", activeforeground="#ffffff"):
-        button.configure(bg=bg, fg=fg, font=font, 
-                         activebackground=activebackground, 
-                         activeforeground=activeforeground,
-                         relief=tk.RAISED, bd=1, padx=10, pady=5)
-        return button
-    
+    """
+    Helper class to apply modern styling to tkinter widgets.
+
+    Labels, entries and buttons are ttk widgets styled once by class (see
+    ResumeGeneratorApp._init_styles); only Text widgets, which have no ttk
+    equivalent, still need per-instance configuration.
+    """
     @staticmethod
     def style_text(text, bg="#ffffff", fg="#333333", font=("Helvetica", 10)):
         text.configure(bg=bg, fg=fg, font=font, relief=tk.SOLID, bd=1)
         return text
 
+# Background asyncio loop and pooled HTTP session for Ollama traffic, created
+# lazily so the network stack never runs on (or blocks) the Tk main thread
+_ASYNC_LOOP = None
+_ASYNC_LOOP_LOCK = threading.Lock()
+_AIOHTTP_SESSION = None
+
+def _get_async_loop():
+    """Start (once) and return the background asyncio event loop"""
+    global _ASYNC_LOOP
+    with _ASYNC_LOOP_LOCK:
+        if _ASYNC_LOOP is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, daemon=True)
+            thread.start()
+            _ASYNC_LOOP = loop
+    return _ASYNC_LOOP
+
+async def _get_aiohttp_session():
+    """Create (once) and return the shared keep-alive aiohttp session"""
+    global _AIOHTTP_SESSION
+    if _AIOHTTP_SESSION is None:
+        _AIOHTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=8, keepalive_timeout=60)
+        )
+    return _AIOHTTP_SESSION
+
+async def _agenerate(prompt, timeout=30, on_token=None, cancel_event=None):
+    """
+    Generate text for one prompt on the shared session, streaming tokens.
+
+    Args:
+        prompt: Prompt string to send
+        timeout: Total timeout in seconds
+        on_token: Optional callable invoked with each token as it arrives
+        cancel_event: Optional threading.Event that aborts the stream when set
+
+    Returns:
+        str: The full generated text
+    """
+    session = await _get_aiohttp_session()
+
+    payload = {
+        "model": OLLAMA_MODEL,
+        "prompt": prompt,
+        "stream": True
+    }
+
+    parts = []
+    async with session.post(OLLAMA_API_URL, json=payload,
+                            timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+        if response.status != 200:
+            raise ConnectionError(f"Error connecting to Ollama API: {response.status}")
+        async for raw in response.content:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            if not raw.strip():
+                continue
+            chunk = json.loads(raw)
+            token = chunk.get("response", "")
+            if token:
+                parts.append(token)
+                if on_token is not None:
+                    on_token(token)
+            if chunk.get("done"):
+                break
+    return "".join(parts)
+
+def agenerate_many(prompts, timeout=30):
+    """
+    Generate responses for several independent prompts concurrently.
+    Wall-clock time is the slowest prompt rather than the sum of all of them.
+
+    Args:
+        prompts: List of prompt strings
+        timeout: Per-prompt timeout in seconds
+
+    Returns:
+        list: Generated responses in the same order as the prompts
+    """
+    if not AIOHTTP_AVAILABLE:
+        raise ImportError("The aiohttp module is required for concurrent generation")
+
+    async def _gather():
+        return await asyncio.gather(*[_agenerate(p, timeout) for p in prompts])
+
+    future = asyncio.run_coroutine_threadsafe(_gather(), _get_async_loop())
+    return future.result(timeout + 5)
+
+# Cached Ollama liveness so repeated checks don't each pay a probe (and a
+# one-second stall when the server is down)
+_OLLAMA_STATE = {"ok": None, "ts": 0.0}
+_OLLAMA_STATE_TTL = 5.0
+# A down daemon is cached longer so rapid clicks don't hammer a dead port
+_OLLAMA_STATE_NEG_TTL = 30.0
+
+OLLAMA_TAGS_URL = OLLAMA_API_URL.replace("/generate", "/tags")
+
+# Shared blocking HTTP session for the no-aiohttp fallback; keep-alive
+# reuses the socket across calls instead of handshaking every time
+_HTTP_SESSION = None
+
+def _http_session():
+    """Build (once) and return a pooled requests.Session"""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        requests = _lazy("requests")
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        session.mount("http://", adapter)
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+async def _probe_ollama():
+    """Hit /api/tags on the pooled session; the kept-alive socket is then
+    reused by the next generate POST"""
+    session = await _get_aiohttp_session()
+    async with session.get(OLLAMA_TAGS_URL,
+                           timeout=aiohttp.ClientTimeout(total=0.5)) as response:
+        return response.status == 200
+
 def check_ollama_connection():
-    """Check if Ollama API is accessible"""
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(1)
-        result = sock.connect_ex(('localhost', 11434))
-        sock.close()
-        return result == 0
-    except:
-        return False
-
-def generate_resume_with_ai(name, job_role, skills, experience, education, email, phone, location, links=""):
-    """Generate a resume using the Ollama API"""
+    """Check if Ollama API is accessible, caching the answer briefly"""
+    now = time.monotonic()
+    if _OLLAMA_STATE["ok"] is not None:
+        ttl = _OLLAMA_STATE_TTL if _OLLAMA_STATE["ok"] else _OLLAMA_STATE_NEG_TTL
+        if now - _OLLAMA_STATE["ts"] < ttl:
+            return _OLLAMA_STATE["ok"]
+
+    if AIOHTTP_AVAILABLE:
+        # Probe over the pooled session so the handshake is paid once and
+        # the warm connection carries the subsequent generation request
+        try:
+            future = asyncio.run_coroutine_threadsafe(_probe_ollama(), _get_async_loop())
+            ok = future.result(timeout=1)
+        except Exception:
+            ok = False
+    else:
+        # Raw connect probe when aiohttp is not installed
+        try:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.settimeout(1)
+            result = sock.connect_ex(('localhost', 11434))
+            sock.close()
+            ok = result == 0
+        except OSError:
+            ok = False
+
+    _OLLAMA_STATE["ok"] = ok
+    _OLLAMA_STATE["ts"] = now
+    return ok
+
+def generate_resume_with_ai(name, job_role, skills, experience, education, email, phone, location, links="",
+                            on_token=None, cancel_event=None):
+    """Generate a resume using the Ollama API, streaming tokens as they arrive"""
     if not REQUESTS_AVAILABLE:
         raise ImportError("The requests module is required for AI generation")
         
     try:
-        # Check if Ollama is available
-        if not check_ollama_connection():
-            raise ConnectionError("Could not connect to Ollama API")
-        
+        # No preflight probe here: the POST itself is the liveness signal,
+        # and its failure both triggers the fallback and refreshes the cache
         # Prepare the prompt for Ollama
-        prompt = f"""Create a professional resume for the following individual:
-
-Name: {name}
-Job Role: {job_role}
-Skills: {skills}
-Experience: {experience}
-Education: {education}
-Email: {email}
-Phone: {phone}
-Location: {location}
-Links: {links}
+        prompt = _build_resume_prompt(name, job_role, skills, experience,
+                                      education, email, phone, location, links)
 
-Format the resume with markdown, using sections for Summary, Skills, Experience, Education, and Contact Information.
-Be concise, professional, and highlight key achievements. Write in third person.
-"""
-        
-        # Create the payload for the API
-        payload = {
-            "model": OLLAMA_MODEL,
-            "prompt": prompt,
-            "stream": False
-        }
-        
-        # Send the request to Ollama
-        response = requests.post(OLLAMA_API_URL, json=payload, timeout=30)
         
-        if response.status_code == 200:
-            result = response.json()
-            generated_resume = result.get("response", "")
-            
-            if not generated_resume:
-                raise ValueError("Received empty response from Ollama")
-            
-            return generated_resume
+        # Send the request through the pooled async session when available,
+        # falling back to a one-shot blocking request otherwise
+        if AIOHTTP_AVAILABLE:
+            future = asyncio.run_coroutine_threadsafe(
+                _agenerate(prompt, on_token=on_token, cancel_event=cancel_event),
+                _get_async_loop())
+            generated_resume = future.result(35)
         else:
-            raise ConnectionError(f"Error connecting to Ollama API: {response.status_code}")
-            
+            payload = {
+                "model": OLLAMA_MODEL,
+                "prompt": prompt,
+                "stream": True
+            }
+
+            response = _http_session().post(OLLAMA_API_URL, json=payload, timeout=30, stream=True)
+
+            if response.status_code != 200:
+                raise ConnectionError(f"Error connecting to Ollama API: {response.status_code}")
+
+            parts = []
+            for raw in response.iter_lines():
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                if not raw:
+                    continue
+                chunk = json.loads(raw)
+                token = chunk.get("response", "")
+                if token:
+                    parts.append(token)
+                    if on_token is not None:
+                        on_token(token)
+                if chunk.get("done"):
+                    break
+            generated_resume = "".join(parts)
+
+        if not generated_resume:
+            raise ValueError("Received empty response from Ollama")
+
+        return generated_resume
+
     except Exception as e:
-        # Fall back to template-based resume formatting
+        # Fall back to template-based resume formatting and remember that the
+        # server is unreachable so the next few checks short-circuit
+        _OLLAMA_STATE["ok"] = False
+        _OLLAMA_STATE["ts"] = time.monotonic()
         print(f"Error generating resume with AI: {str(e)}")
         return format_resume_from_template(name, job_role, skills, experience, education, email, phone, location, links)
 
+@functools.lru_cache(maxsize=64)
 def format_resume_from_template(name, job_role, skills, experience, education, email, phone, location, links="", template_name="modern"):
-    """Format resume using templates when AI generation is unavailable"""
+    """Format resume using templates when AI generation is unavailable.
+
+    Memoized on the full input tuple: repeated renders of an unchanged
+    form (preview refreshes, format toggles) return the cached string."""
     # Use imported templates if available, otherwise use basic templates
     if TEMPLATES_AVAILABLE:
-        return resume_templates.format_resume(
+        return _lazy("resume_templates").format_resume(
             template_name,
             name=name,
             job_role=job_role,
@@ -243,10 +466,10 @@ def format_resume_from_template(name, job_role, skills, experience, education, e
             links=links
         )
     else:
-        # Use basic templates
-        template = BASIC_TEMPLATES.get(template_name.lower(), BASIC_TEMPLATES["modern"])
+        # Use basic templates (compiled to plain functions at import)
+        fill = _COMPILED_TEMPLATES.get(template_name.lower(), _COMPILED_TEMPLATES["modern"])
         
-        return template.format(
+        return fill(
             name=name,
             job_role=job_role,
             summary=get_summary(job_role),
@@ -259,22 +482,37 @@ def format_resume_from_template(name, job_role, skills, experience, education, e
             links=links
         )
 
+@functools.lru_cache(maxsize=128)
 def get_summary(job_role):
-    """Generate a summary based on job role"""
+    """
+    Generate a summary based on job role.
+
+    Results are cached per role: template re-renders and preview refreshes
+    reuse the earlier suggestion instead of repeating the AI round-trip.
+    Call get_summary.cache_clear() to force fresh suggestions.
+    """
     if AI_SUGGESTIONS_AVAILABLE:
-        return ai_suggestions.get_summary_suggestion(job_role)
+        return _lazy("ai_suggestions").get_summary_suggestion(job_role)
     
     # Default summary if AI suggestions not available
     return f"Experienced {job_role} with a proven track record of delivering high-quality results."
 
+def _write_bytes(path, data):
+    """Write an already-encoded blob through a raw fd, skipping text-IO
+    buffering and its per-write encode"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
 def save_resume_as_text(resume_text, filename="resume.txt"):
     """Save resume as text file"""
     if EXPORT_AVAILABLE:
-        return resume_export.save_as_text(resume_text, filename)
+        return _lazy("resume_export").save_as_text(resume_text, filename)
     else:
-        # Fallback if export module not available
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(resume_text)
+        # Fallback if export module not available: encode once, write once
+        _write_bytes(filename, resume_text.encode("utf-8"))
         return os.path.abspath(filename)
 
 def export_resume(resume_text, format_type="txt", filename=None):
@@ -287,38 +525,99 @@ def export_resume(resume_text, format_type="txt", filename=None):
         filename = f"resume_{timestamp}"
     
     if format_type == "txt":
-        return resume_export.save_as_text(resume_text, f"{filename}.txt")
+        return _lazy("resume_export").save_as_text(resume_text, f"{filename}.txt")
     elif format_type == "html":
-        return resume_export.save_as_html(resume_text, f"{filename}.html")
-    elif format_type == "docx" and hasattr(resume_export, 'save_as_docx'):
-        return resume_export.save_as_docx(resume_text, f"{filename}.docx")
-    elif format_type == "pdf" and hasattr(resume_export, 'save_as_pdf'):
-        return resume_export.save_as_pdf(resume_text, f"{filename}.pdf")
+        return _lazy("resume_export").save_as_html(resume_text, f"{filename}.html")
+    elif format_type == "docx" and hasattr(_lazy("resume_export"), 'save_as_docx'):
+        return _lazy("resume_export").save_as_docx(resume_text, f"{filename}.docx")
+    elif format_type == "pdf" and hasattr(_lazy("resume_export"), 'save_as_pdf'):
+        return _lazy("resume_export").save_as_pdf(resume_text, f"{filename}.pdf")
     else:
         # Default to text format
         return save_resume_as_text(resume_text, f"{filename}.txt")
 
+def export_resume_multi(resume_text, formats, filename=None):
+    """
+    Export a resume in several formats at once.
+
+    The per-format writes run concurrently on the background event loop,
+    so an "export all" completes in roughly the time of the slowest format
+    rather than the sum of all of them.
+
+    Args:
+        resume_text: Resume text content
+        formats: Iterable of format names ("txt", "html", "docx", "pdf")
+        filename: Base filename without extension (timestamped if omitted)
+
+    Returns:
+        list: Saved paths (or error strings) in the same order as formats
+    """
+    formats = list(formats)
+
+    if filename is None:
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"resume_{timestamp}"
+
+    async def _gather():
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*[
+            loop.run_in_executor(None, export_resume, resume_text, fmt, filename)
+            for fmt in formats
+        ])
+
+    future = asyncio.run_coroutine_threadsafe(_gather(), _get_async_loop())
+    return future.result()
+
+@functools.lru_cache(maxsize=16)
+def _render_qr(url, name, is_linkedin):
+    """Render a QR code PNG, memoized on the inputs that shape the image"""
+    if is_linkedin:
+        # Use LinkedIn themed QR code if it's a LinkedIn URL
+        return _lazy("qr_generator").generate_qr_with_linkedin_template(url, name)
+    return _lazy("qr_generator").generate_qr_code(url)
+
 def save_resume_to_history(resume_data):
-    """Save resume to history file"""
-    history = []
-    
-    # Load existing history if available
-    if os.path.exists(HISTORY_FILE):
-        try:
-            with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-                history = json.load(f)
-        except:
-            pass
-    
+    """Append resume to the history file without rewriting earlier entries"""
     # Add timestamp
     resume_data["timestamp"] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    # Add to history
-    history.append(resume_data)
+    # One compact line per resume; cost stays constant as the history grows
+    with open(HISTORY_FILE_JSONL, "ab") as f:
+        f.write(_json_dumps(resume_data) + b"\n")
+
+def _migrate_legacy_history():
+    """One-time conversion of the legacy list-format JSON history to JSONL.
+
+    The old file is parked with a .bak suffix afterwards so the migration
+    never runs twice and nothing is deleted."""
+    if not os.path.exists(HISTORY_FILE):
+        return
     
-    # Save history
-    with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-        json.dump(history, f, indent=4)
+    try:
+        with open(HISTORY_FILE, "rb") as f:
+            legacy = _json_loads(f.read())
+        with open(HISTORY_FILE_JSONL, "ab") as f:
+            for entry in legacy:
+                f.write(_json_dumps(entry) + b"\n")
+        os.replace(HISTORY_FILE, HISTORY_FILE + ".bak")
+    except (OSError, ValueError):
+        pass
+
+def load_resume_history():
+    """Load all saved resumes, migrating the legacy JSON file if present"""
+    _migrate_legacy_history()
+    
+    history = []
+    if os.path.exists(HISTORY_FILE_JSONL):
+        try:
+            with open(HISTORY_FILE_JSONL, "rb") as f:
+                for line in f:
+                    if line.strip():
+                        history.append(_json_loads(line))
+        except (OSError, ValueError):
+            pass
+    
+    return history
 
 class ResumeGeneratorApp:
     """Main application class for the Resume Generator"""
@@ -346,12 +645,58 @@ class ResumeGeneratorApp:
         # Resume text
         self.resume_text = ""
         
+        # Set by the Stop button to abort an in-flight AI generation
+        self.generate_cancel = threading.Event()
+        
+        # Worker pool for generation so the Tk thread never blocks on
+        # Ollama; the semaphore caps in-flight requests against the server
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.generate_sem = threading.BoundedSemaphore(2)
+        
+        # Register widget styles once; per-widget configure calls each cost
+        # a Python-to-Tcl crossing, a class style is resolved inside Tk
+        self._init_styles()
+        
+        # Coalesces rapid edits into one preview render (see _schedule_preview)
+        self._pending_preview = None
+        
+        # Timestamp of the last forced idle-task flush (see _pulse)
+        self._last_tick = 0.0
+        
+        # Help window is built once and hidden on close (see show_help)
+        self._help_window = None
+        
         # Create UI
         self.create_ui()
         
+        # Re-render the preview when form fields or text areas change
+        self._bind_preview_refresh()
+        
         # Check Ollama connection
         self.check_ollama_status()
     
+    def _init_styles(self):
+        """Define the ttk styles shared by every label, entry and button"""
+        style = ttk.Style(self.root)
+        style.theme_use("clam")
+        
+        style.configure("Modern.TLabel", background="#f0f0f0", foreground="#333333",
+                        font=("Helvetica", 10))
+        style.configure("Modern.TEntry", fieldbackground="#ffffff", foreground="#333333")
+        
+        button_font = ("Helvetica", 10, "bold")
+        for name, bg, active_bg in (
+            ("Modern.TButton", "#4a6fa5", "#3b5998"),
+            ("Success.TButton", "#28a745", "#218838"),
+            ("Primary.TButton", "#007bff", "#0069d9"),
+            ("Danger.TButton", "#dc3545", "#c82333"),
+            ("Secondary.TButton", "#6c757d", "#5a6268"),
+            ("Info.TButton", "#5bc0de", "#31b0d5"),
+        ):
+            style.configure(name, background=bg, foreground="#ffffff",
+                            font=button_font, padding=(10, 5))
+            style.map(name, background=[("active", active_bg)])
+    
     def create_ui(self):
         """Create the user interface"""
         # Create main frames
@@ -360,12 +705,15 @@ class ResumeGeneratorApp:
         self.create_footer_frame()
     
     def check_ollama_status(self):
-        """Check Ollama connection status"""
+        """Check Ollama connection status and keep polling in the background"""
         if check_ollama_connection():
             self.connection_label.config(text="API is accessible")
         else:
             self.connection_label.config(text="API is not accessible")
 
+        # Re-check periodically so the label stays fresh without blocking
+        self.root.after(5000, self.check_ollama_status)
+
     def create_header_frame(self):
         """Create the header frame with app title and status"""
         header_frame = tk.Frame(self.root, bg="#4a6fa5", height=60)
@@ -437,30 +785,36 @@ class ResumeGeneratorApp:
         generate_frame = tk.Frame(form_frame, bg="#f0f0f0", pady=10)
         generate_frame.pack(fill=tk.X)
         
-        generate_button = tk.Button(generate_frame, text="Generate Resume", 
-                                  command=self.generate_resume)
-        ModernWidget.style_button(generate_button, bg="#28a745", activebackground="#218838")
-        generate_button.pack(fill=tk.X, padx=20)
+        self.generate_button = ttk.Button(generate_frame, text="Generate Resume", 
+                                          command=self.generate_resume, style="Success.TButton")
+        self.generate_button.pack(fill=tk.X, padx=20)
     
-    def create_personal_info_form(self, parent):
-        """Create the personal information form"""
-        # Create a canvas with scrollbar
+    def _scrollable(self, parent):
+        """Build the standard canvas + scrollbar container and return the
+        inner frame that form content should be packed into"""
         canvas = tk.Canvas(parent, bg="#f0f0f0")
         scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scroll_frame = tk.Frame(canvas, bg="#f0f0f0")
+        inner = tk.Frame(canvas, bg="#f0f0f0")
         
-        scroll_frame.bind(
+        inner.bind(
             "<Configure>",
             lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
         )
         
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
+        canvas.create_window((0, 0), window=inner, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
         
-        # Form fields
+        return inner
+    
+    def create_personal_info_form(self, parent):
+        """Create the personal information form"""
+        scroll_frame = self._scrollable(parent)
+        
+        # Form fields laid out on one grid: a single geometry pass instead
+        # of a wrapper frame plus two pack calls per field
         fields = [
             ("Full Name", self.name_var),
             ("Job Role", self.job_role_var),
@@ -471,35 +825,17 @@ class ResumeGeneratorApp:
             ("Website URL", self.website_var)
         ]
         
+        scroll_frame.columnconfigure(1, weight=1)
         for i, (label_text, var) in enumerate(fields):
-            frame = tk.Frame(scroll_frame, bg="#f0f0f0", pady=5)
-            frame.pack(fill=tk.X, padx=10)
+            label = ttk.Label(scroll_frame, text=label_text, width=15, anchor="w", style="Modern.TLabel")
+            label.grid(row=i, column=0, sticky="w", padx=(10, 0), pady=5)
             
-            label = tk.Label(frame, text=label_text, width=15, anchor="w")
-            ModernWidget.style_label(label)
-            label.pack(side=tk.LEFT)
-            
-            entry = tk.Entry(frame, textvariable=var, width=30)
-            ModernWidget.style_entry(entry)
-            entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+            entry = ttk.Entry(scroll_frame, textvariable=var, width=30, style="Modern.TEntry")
+            entry.grid(row=i, column=1, sticky="ew", padx=(0, 10), pady=5)
     
     def create_experience_form(self, parent):
         """Create the experience form"""
-        # Create a canvas with scrollbar
-        canvas = tk.Canvas(parent, bg="#f0f0f0")
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scroll_frame = tk.Frame(canvas, bg="#f0f0f0")
-        
-        scroll_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        scroll_frame = self._scrollable(parent)
         
         # Instructions
         instructions = tk.Label(scroll_frame, text="Enter your work experience (most recent first)",
@@ -507,8 +843,8 @@ class ResumeGeneratorApp:
         instructions.pack(pady=10)
         
         # Experience text area
-        experience_label = tk.Label(scroll_frame, text="Experience (Markdown format):", anchor="w")
-        ModernWidget.style_label(experience_label)
+        experience_label = ttk.Label(scroll_frame, text="Experience (Markdown format):", anchor="w",
+                                     style="Modern.TLabel")
         experience_label.pack(fill=tk.X, padx=10, pady=(10, 5))
         
         self.experience_text = scrolledtext.ScrolledText(scroll_frame, height=15)
@@ -532,28 +868,13 @@ class ResumeGeneratorApp:
             suggestion_frame = tk.Frame(scroll_frame, bg="#f0f0f0", pady=5)
             suggestion_frame.pack(fill=tk.X, padx=10)
             
-            suggest_button = tk.Button(suggestion_frame, text="Get Suggestions", 
-                                    command=self.get_experience_suggestions)
-            ModernWidget.style_button(suggest_button, bg="#6c757d", activebackground="#5a6268")
+            suggest_button = ttk.Button(suggestion_frame, text="Get Suggestions", 
+                                      command=self.get_experience_suggestions, style="Secondary.TButton")
             suggest_button.pack(side=tk.LEFT)
     
     def create_education_form(self, parent):
         """Create the education form"""
-        # Create a canvas with scrollbar
-        canvas = tk.Canvas(parent, bg="#f0f0f0")
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scroll_frame = tk.Frame(canvas, bg="#f0f0f0")
-        
-        scroll_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        scroll_frame = self._scrollable(parent)
         
         # Instructions
         instructions = tk.Label(scroll_frame, text="Enter your education (most recent first)",
@@ -561,8 +882,8 @@ class ResumeGeneratorApp:
         instructions.pack(pady=10)
         
         # Education text area
-        education_label = tk.Label(scroll_frame, text="Education (Markdown format):", anchor="w")
-        ModernWidget.style_label(education_label)
+        education_label = ttk.Label(scroll_frame, text="Education (Markdown format):", anchor="w",
+                                    style="Modern.TLabel")
         education_label.pack(fill=tk.X, padx=10, pady=(10, 5))
         
         self.education_text = scrolledtext.ScrolledText(scroll_frame, height=10)
@@ -576,21 +897,7 @@ class ResumeGeneratorApp:
     
     def create_skills_form(self, parent):
         """Create the skills form"""
-        # Create a canvas with scrollbar
-        canvas = tk.Canvas(parent, bg="#f0f0f0")
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scroll_frame = tk.Frame(canvas, bg="#f0f0f0")
-        
-        scroll_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        scroll_frame = self._scrollable(parent)
         
         # Instructions
         instructions = tk.Label(scroll_frame, text="Enter your skills (comma separated)",
@@ -598,8 +905,7 @@ class ResumeGeneratorApp:
         instructions.pack(pady=10)
         
         # Skills text area
-        skills_label = tk.Label(scroll_frame, text="Skills:", anchor="w")
-        ModernWidget.style_label(skills_label)
+        skills_label = ttk.Label(scroll_frame, text="Skills:", anchor="w", style="Modern.TLabel")
         skills_label.pack(fill=tk.X, padx=10, pady=(10, 5))
         
         self.skills_text = scrolledtext.ScrolledText(scroll_frame, height=10)
@@ -612,28 +918,13 @@ class ResumeGeneratorApp:
             suggestion_frame = tk.Frame(scroll_frame, bg="#f0f0f0", pady=5)
             suggestion_frame.pack(fill=tk.X, padx=10)
             
-            suggest_button = tk.Button(suggestion_frame, text="Suggest Skills", 
-                                    command=self.get_skills_suggestions)
-            ModernWidget.style_button(suggest_button, bg="#6c757d", activebackground="#5a6268")
+            suggest_button = ttk.Button(suggestion_frame, text="Suggest Skills", 
+                                      command=self.get_skills_suggestions, style="Secondary.TButton")
             suggest_button.pack(side=tk.LEFT)
     
     def create_template_form(self, parent):
         """Create the template selection form"""
-        # Create a canvas with scrollbar
-        canvas = tk.Canvas(parent, bg="#f0f0f0")
-        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=canvas.yview)
-        scroll_frame = tk.Frame(canvas, bg="#f0f0f0")
-        
-        scroll_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        scroll_frame = self._scrollable(parent)
         
         # Template selection
         template_label = tk.Label(scroll_frame, text="Select Template:", 
@@ -693,28 +984,34 @@ class ResumeGeneratorApp:
         ModernWidget.style_text(self.preview_text)
         self.preview_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        # Styling tags configured once; tag_add batches reuse them
+        self.preview_text.tag_configure("md_header", font=("Helvetica", 12, "bold"),
+                                        foreground="#2c3e50")
+        self.preview_text.tag_configure("md_bold", font=("Helvetica", 10, "bold"))
+        
         # Set initial content
         self.preview_text.insert(tk.END, "Your resume preview will appear here...")
         
-        # Export button
-        export_button = tk.Button(preview_frame, text="Export Resume", 
-                                command=self.export_current_resume)
-        ModernWidget.style_button(export_button, bg="#007bff", activebackground="#0069d9")
+        # Export and stop buttons
+        export_button = ttk.Button(preview_frame, text="Export Resume", 
+                                 command=self.export_current_resume, style="Primary.TButton")
         export_button.pack(pady=10)
         
+        stop_button = ttk.Button(preview_frame, text="Stop Generation", 
+                               command=self.cancel_generation, style="Danger.TButton")
+        stop_button.pack(pady=(0, 10))
+        
         # Enhancement options (if available)
         if TEXT_ENHANCER_AVAILABLE:
             enhance_frame = tk.Frame(preview_frame, bg="#f0f0f0")
             enhance_frame.pack(fill=tk.X, pady=10)
             
-            spell_check_button = tk.Button(enhance_frame, text="Spell Check", 
-                                        command=self.check_spelling)
-            ModernWidget.style_button(spell_check_button, bg="#6c757d", activebackground="#5a6268")
+            spell_check_button = ttk.Button(enhance_frame, text="Spell Check", 
+                                          command=self.check_spelling, style="Secondary.TButton")
             spell_check_button.pack(side=tk.LEFT, padx=5)
             
-            enhance_button = tk.Button(enhance_frame, text="Enhance Text", 
-                                    command=self.enhance_resume)
-            ModernWidget.style_button(enhance_button, bg="#6c757d", activebackground="#5a6268")
+            enhance_button = ttk.Button(enhance_frame, text="Enhance Text", 
+                                      command=self.enhance_resume, style="Secondary.TButton")
             enhance_button.pack(side=tk.LEFT, padx=5)
             
             self.ats_score_var = tk.StringVar(value="ATS Score: Not calculated")
@@ -755,18 +1052,17 @@ class ResumeGeneratorApp:
         file_frame.pack(fill=tk.X, pady=10)
         
         self.linkedin_file_var = tk.StringVar()
-        file_entry = tk.Entry(file_frame, textvariable=self.linkedin_file_var, width=30)
-        ModernWidget.style_entry(file_entry)
+        file_entry = ttk.Entry(file_frame, textvariable=self.linkedin_file_var, width=30,
+                               style="Modern.TEntry")
         file_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
-        browse_button = tk.Button(file_frame, text="Browse", command=self.browse_linkedin_file)
-        ModernWidget.style_button(browse_button)
+        browse_button = ttk.Button(file_frame, text="Browse", command=self.browse_linkedin_file,
+                                   style="Modern.TButton")
         browse_button.pack(side=tk.RIGHT, padx=5)
         
         # Import button
-        import_button = tk.Button(frame, text="Import LinkedIn Data", 
-                                command=self.import_linkedin_data)
-        ModernWidget.style_button(import_button, bg="#5bc0de", activebackground="#31b0d5")
+        import_button = ttk.Button(frame, text="Import LinkedIn Data", 
+                                 command=self.import_linkedin_data, style="Info.TButton")
         import_button.pack(pady=20)
         
         # Status
@@ -799,58 +1095,117 @@ class ResumeGeneratorApp:
             messagebox.showerror("Import Error", "Select a valid LinkedIn export file")
             return
         
+        # Update status, then parse on a worker thread so a multi-MB export
+        # never stalls the Tk main loop
+        self.linkedin_status.config(text="Importing data...")
+        
+        future = self.executor.submit(self._parse_linkedin_file, file_path)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_linkedin_imported, f, file_path))
+    
+    def _parse_linkedin_file(self, file_path):
+        """Parse and pre-format a LinkedIn export off the Tk thread"""
+        # Re-importing the same export is common; a content-addressed pickle
+        # cache turns the repeat parse into a single small file read
+        mtime = os.path.getmtime(file_path)
+        with open(file_path, "rb") as f:
+            key = hashlib.sha1(f.read()).hexdigest()
+        cache_path = LINKEDIN_CACHE_DIR / f"{key}.pkl"
+        
         try:
-            # Update status
-            self.linkedin_status.config(text="Importing data...")
-            self.root.update_idletasks()
-            
-            # Determine file type and parse
-            file_extension = os.path.splitext(file_path)[1].lower()
-            
-            if file_extension == '.json':
-                profile_data = linkedin_import.parse_linkedin_json(file_path)
-            elif file_extension == '.csv':
-                profile_data = linkedin_import.parse_linkedin_csv(file_path)
-            else:
-                raise ValueError("Unsupported file format. Use JSON or CSV LinkedIn export files.")
-            
-            # Populate form fields with imported data
-            if profile_data.get('name'):
-                self.name_var.set(profile_data['name'])
-            
-            if profile_data.get('job_role'):
-                self.job_role_var.set(profile_data['job_role'])
-            
-            if profile_data.get('contact_info', {}).get('email'):
-                self.email_var.set(profile_data['contact_info']['email'])
-            
-            if profile_data.get('location'):
-                self.location_var.set(profile_data['location'])
-            
-            if profile_data.get('skills'):
-                self.skills_text.delete("1.0", tk.END)
-                self.skills_text.insert(tk.END, ", ".join(profile_data['skills']))
-            
-            if profile_data.get('experience'):
-                # Format experience for the form
-                experience_text = linkedin_import.format_experience_for_resume(profile_data['experience'])
-                self.experience_text.delete("1.0", tk.END)
-                self.experience_text.insert(tk.END, experience_text)
-            
-            if profile_data.get('education'):
-                # Format education for the form
-                education_text = linkedin_import.format_education_for_resume(profile_data['education'])
-                self.education_text.delete("1.0", tk.END)
-                self.education_text.insert(tk.END, education_text)
-            
-            # Update status
-            self.linkedin_status.config(
-                text=f"Data imported successfully from {os.path.basename(file_path)}"
-            )
+            with open(cache_path, "rb") as f:
+                cached_mtime, result = pickle.load(f)
+            if cached_mtime == mtime:
+                return result
+        except (OSError, pickle.PickleError, EOFError, ValueError):
+            pass
+        
+        result = self._parse_linkedin_file_uncached(file_path)
+        
+        try:
+            LINKEDIN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump((mtime, result), f)
+        except OSError:
+            pass
+        
+        return result
+    
+    def _parse_linkedin_file_uncached(self, file_path):
+        """Do the actual parse and formatting for a LinkedIn export"""
+        file_extension = os.path.splitext(file_path)[1].lower()
+        linkedin = _lazy("linkedin_import")
+        
+        # Dispatch on extension; adding formats (.zip archives, .xml) is a
+        # one-entry change here
+        parsers = {
+            '.json': linkedin.parse_linkedin_json,
+            '.csv': linkedin.parse_linkedin_csv,
+        }
+        parser = parsers.get(file_extension)
+        if parser is None:
+            raise ValueError("Unsupported file format. Use JSON or CSV LinkedIn export files.")
+        
+        profile_data = parser(file_path)
+        
+        # Formatting walks every entry, so do it here too and hand the Tk
+        # thread ready-to-insert strings
+        experience_text = ""
+        if profile_data.get('experience'):
+            experience_text = linkedin.format_experience_for_resume(profile_data['experience'])
+        
+        education_text = ""
+        if profile_data.get('education'):
+            education_text = linkedin.format_education_for_resume(profile_data['education'])
         
+        return profile_data, experience_text, education_text
+    
+    def _on_linkedin_imported(self, future, file_path):
+        """Populate the form from a finished import back on the Tk thread"""
+        try:
+            profile_data, experience_text, education_text = future.result()
         except Exception as e:
             self.linkedin_status.config(text=f"Import error: {str(e)}")
             messagebox.showerror("Import Error", str(e))
+            return
+        
+        # Destructure the profile once instead of repeated .get chains
+        name = profile_data.get('name')
+        job_role = profile_data.get('job_role')
+        location = profile_data.get('location')
+        skills = profile_data.get('skills')
+        contact = profile_data.get('contact_info') or {}
+        email = contact.get('email')
+        
+        # Populate form fields with imported data
+        if name:
+            self.name_var.set(name)
+        
+        if job_role:
+            self.job_role_var.set(job_role)
+        
+        if email:
+            self.email_var.set(email)
+        
+        if location:
+            self.location_var.set(location)
+        
+        if skills:
+            self.skills_text.delete("1.0", tk.END)
+            self.skills_text.insert(tk.END, ", ".join(skills))
+        
+        if experience_text:
+            self.experience_text.delete("1.0", tk.END)
+            self.experience_text.insert(tk.END, experience_text)
+        
+        if education_text:
+            self.education_text.delete("1.0", tk.END)
+            self.education_text.insert(tk.END, education_text)
+        
+        # Update status
+        self.linkedin_status.config(
+            text=f"Data imported successfully from {os.path.basename(file_path)}"
+        )
     
     def get_skills_suggestions(self):
         """Get AI-powered skill suggestions"""
@@ -864,35 +1219,41 @@ class ResumeGeneratorApp:
             messagebox.showinfo("Suggestions", "Enter a job role first")
             return
         
-        try:
-            # Update status
-            self.status_var.set("Getting skills suggestions...")
-            self.root.update_idletasks()
-            
-            # Get suggestions
-            suggestions = ai_suggestions.get_skill_suggestions(job_role)
-            
-            if not suggestions:
-                messagebox.showinfo("Suggestions", "No suggestions available for this job role")
-                return
-            
-            # Format suggestions
-            suggested_skills = ", ".join(suggestions)
-            
-            # Ask if user wants to use suggestions
-            if messagebox.askyesno("Skills Suggestions", 
-                                  f"Suggested skills for {job_role}:\n\n{suggested_skills}\n\nUse these suggestions?"):
-                
-                # Replace skills
-                self.skills_text.delete("1.0", tk.END)
-                self.skills_text.insert(tk.END, suggested_skills)
-            
-            # Update status
-            self.status_var.set("Skills suggestions retrieved")
+        # Update status, then fetch on the worker pool so the AI round-trip
+        # never freezes the window
+        self.status_var.set("Getting skills suggestions...")
         
+        future = self.executor.submit(
+            _lazy("ai_suggestions").get_skill_suggestions, job_role)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_skills_suggestions, f, job_role))
+    
+    def _on_skills_suggestions(self, future, job_role):
+        """Present fetched skill suggestions back on the Tk thread"""
+        try:
+            suggestions = future.result()
         except Exception as e:
             self.status_var.set(f"Suggestion error: {str(e)}")
             messagebox.showerror("Suggestion Error", str(e))
+            return
+        
+        if not suggestions:
+            messagebox.showinfo("Suggestions", "No suggestions available for this job role")
+            return
+        
+        # Format suggestions
+        suggested_skills = ", ".join(suggestions)
+        
+        # Ask if user wants to use suggestions
+        if messagebox.askyesno("Skills Suggestions", 
+                              f"Suggested skills for {job_role}:\n\n{suggested_skills}\n\nUse these suggestions?"):
+            
+            # Replace skills
+            self.skills_text.delete("1.0", tk.END)
+            self.skills_text.insert(tk.END, suggested_skills)
+        
+        # Update status
+        self.status_var.set("Skills suggestions retrieved")
     
     def get_experience_suggestions(self):
         """Get AI-powered experience suggestions"""
@@ -918,13 +1279,12 @@ class ResumeGeneratorApp:
             frame = tk.Frame(position_dialog, bg="#f0f0f0", pady=10)
             frame.pack(fill=tk.X, padx=10)
             
-            label = tk.Label(frame, text="Position Title:", width=15, anchor="w")
-            ModernWidget.style_label(label)
+            label = ttk.Label(frame, text="Position Title:", width=15, anchor="w",
+                              style="Modern.TLabel")
             label.pack(side=tk.LEFT)
             
             position_var = tk.StringVar()
-            entry = tk.Entry(frame, textvariable=position_var, width=30)
-            ModernWidget.style_entry(entry)
+            entry = ttk.Entry(frame, textvariable=position_var, width=30, style="Modern.TEntry")
             entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
             
             # Suggestion result area
@@ -937,6 +1297,19 @@ class ResumeGeneratorApp:
             result_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
             
             # Get suggestion button
+            def show_position_suggestion(future):
+                try:
+                    bullet_points = future.result()
+                except Exception as e:
+                    messagebox.showerror("Suggestion Error", str(e))
+                    return
+                
+                # Display suggestion (the dialog may have been closed mid-fetch)
+                if not result_text.winfo_exists():
+                    return
+                result_text.delete("1.0", tk.END)
+                result_text.insert(tk.END, "\n".join(f"- {point}" for point in bullet_points))
+            
             def get_position_suggestion():
                 position = position_var.get().strip()
                 
@@ -944,23 +1317,19 @@ class ResumeGeneratorApp:
                     messagebox.showinfo("Suggestions", "Enter a position title")
                     return
                 
-                try:
-                    # Get suggestion
-                    bullet_points = ai_suggestions.get_experience_bullet_points(job_role, position, 3)
-                    
-                    # Display suggestion
-                    result_text.delete("1.0", tk.END)
-                    result_text.insert(tk.END, "\n".join([f"- {point}" for point in bullet_points]))
-                
-                except Exception as e:
-                    messagebox.showerror("Suggestion Error", str(e))
+                # Fetch on the worker pool; the dialog stays responsive
+                future = self.executor.submit(
+                    _lazy("ai_suggestions").get_experience_bullet_points,
+                    job_role, position, 3)
+                future.add_done_callback(
+                    lambda f: self.root.after(0, show_position_suggestion, f))
             
             # Action buttons
             button_frame = tk.Frame(position_dialog, bg="#f0f0f0", pady=10)
             button_frame.pack(fill=tk.X, padx=10)
             
-            get_button = tk.Button(button_frame, text="Get Suggestion", command=get_position_suggestion)
-            ModernWidget.style_button(get_button)
+            get_button = ttk.Button(button_frame, text="Get Suggestion", command=get_position_suggestion,
+                                    style="Modern.TButton")
             get_button.pack(side=tk.LEFT, padx=5)
             
             def use_suggestion():
@@ -969,21 +1338,15 @@ class ResumeGeneratorApp:
                 if not suggestion:
                     return
                 
-                # Get current experience text
-                current_text = self.experience_text.get("1.0", tk.END)
+                # Insert under the first job section in place; the widget
+                # finds the boundaries, no full-text copy or rewrite
+                first_section = self.experience_text.search("###", "1.0", tk.END)
                 
-                # Add suggestion as a bullet point to the first job
-                import re
-                sections = re.split(r'(###.*)', current_text)
-                
-                if len(sections) >= 3:  # Has at least one job section
-                    # Add to the first job section
-                    sections[2] = sections[2].rstrip() + f"\n{suggestion}\n"
-                    
-                    # Update experience text
-                    new_text = "".join(sections)
-                    self.experience_text.delete("1.0", tk.END)
-                    self.experience_text.insert(tk.END, new_text)
+                if first_section:
+                    next_section = self.experience_text.search(
+                        "\n###", f"{first_section}+1l", tk.END)
+                    insert_at = next_section or self.experience_text.index(f"{tk.END}-1c")
+                    self.experience_text.insert(insert_at, f"\n{suggestion}\n")
                 else:
                     # Just append to current text
                     self.experience_text.insert(tk.END, f"\n{suggestion}")
@@ -991,13 +1354,12 @@ class ResumeGeneratorApp:
                 # Close dialog
                 position_dialog.destroy()
             
-            use_button = tk.Button(button_frame, text="Use Suggestion", command=use_suggestion)
-            ModernWidget.style_button(use_button, bg="#28a745", activebackground="#218838")
+            use_button = ttk.Button(button_frame, text="Use Suggestion", command=use_suggestion,
+                                    style="Success.TButton")
             use_button.pack(side=tk.LEFT, padx=5)
             
-            cancel_button = tk.Button(button_frame, text="Cancel", 
-                                   command=position_dialog.destroy)
-            ModernWidget.style_button(cancel_button, bg="#dc3545", activebackground="#c82333")
+            cancel_button = ttk.Button(button_frame, text="Cancel", 
+                                     command=position_dialog.destroy, style="Danger.TButton")
             cancel_button.pack(side=tk.RIGHT, padx=5)
         
         except Exception as e:
@@ -1005,7 +1367,13 @@ class ResumeGeneratorApp:
             messagebox.showerror("Suggestion Error", str(e))
     
     def show_help(self):
-        """Show help information"""
+        """Show help information, reusing one hidden window across opens"""
+        # Re-show the existing window instead of rebuilding it
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._help_window.deiconify()
+            self._help_window.lift()
+            return
+        
         help_text = """
 Enhanced Resume Generator Help
 
@@ -1031,11 +1399,14 @@ Tips:
 For more information, visit the help documentation.
 """
         
-        # Create help window
+        # Create help window once; Close and the window manager both hide
+        # it rather than destroy it
         help_window = tk.Toplevel(self.root)
         help_window.title("Resume Generator Help")
         help_window.geometry("600x400")
         help_window.configure(bg="#f0f0f0")
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
+        self._help_window = help_window
         
         # Help text area
         help_text_area = scrolledtext.ScrolledText(help_window, wrap=tk.WORD)
@@ -1046,97 +1417,206 @@ For more information, visit the help documentation.
         help_text_area.insert(tk.END, help_text)
         
         # Close button
-        close_button = tk.Button(help_window, text="Close", command=help_window.destroy)
-        ModernWidget.style_button(close_button)
+        close_button = ttk.Button(help_window, text="Close", command=help_window.withdraw,
+                                  style="Modern.TButton")
         close_button.pack(pady=10)
 
+    def _bind_preview_refresh(self):
+        """Wire form inputs to the debounced preview refresh"""
+        for var in (self.name_var, self.job_role_var, self.email_var,
+                    self.phone_var, self.location_var, self.linkedin_var,
+                    self.website_var, self.template_var):
+            var.trace_add("write", lambda *args: self._schedule_preview())
+        
+        for widget in (self.skills_text, self.experience_text, self.education_text):
+            widget.bind("<<Modified>>", self._on_text_modified)
+    
+    def _on_text_modified(self, event):
+        """Reset the Text modified flag and schedule a preview refresh"""
+        if event.widget.edit_modified():
+            event.widget.edit_modified(False)
+            self._schedule_preview()
+    
+    def _schedule_preview(self):
+        """Debounce preview renders: one render per pause, not per keystroke"""
+        if self._pending_preview is not None:
+            self.root.after_cancel(self._pending_preview)
+        self._pending_preview = self.root.after(150, self._refresh_preview)
+    
+    def _refresh_preview(self):
+        """Render a template preview from the current form data"""
+        self._pending_preview = None
+        
+        # Don't fight an in-flight AI generation streaming into the preview
+        if self.generate_button.instate(["disabled"]):
+            return
+        
+        form = self._form_snapshot()
+        if not form["name"] or not form["job_role"]:
+            return
+        
+        self.resume_text = format_resume_from_template(
+            form["name"], form["job_role"], form["skills"], form["experience"],
+            form["education"], form["email"], form["phone"], form["location"],
+            form["links"], form["template"]
+        )
+        self.preview_text.delete("1.0", tk.END)
+        self.preview_text.insert(tk.END, self.resume_text)
+    
+    def _pulse(self):
+        """Flush idle tasks at most ~30 times a second; callers in loops can
+        invoke this freely without paying a reflow per iteration"""
+        now = time.monotonic()
+        if now - self._last_tick > 1 / 30:
+            self.root.update_idletasks()
+            self._last_tick = now
+    
+    def _patch_text_widget(self, widget, new_text):
+        """Update a Text widget by rewriting only the changed line ranges,
+        so reflow cost tracks the size of the edit, not the document"""
+        old_lines = widget.get("1.0", "end-1c").splitlines(True)
+        new_lines = new_text.splitlines(True)
+        
+        offset = 0  # net lines added/removed by earlier opcodes
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                continue
+            start = i1 + offset + 1
+            if tag in ("replace", "delete"):
+                widget.delete(f"{start}.0", f"{i2 + offset + 1}.0")
+            if tag in ("replace", "insert"):
+                widget.insert(f"{start}.0", "".join(new_lines[j1:j2]))
+            offset += (j2 - j1) - (i2 - i1)
+    
+    def _style_preview(self):
+        """Tag markdown headers and bold spans in one batch per tag"""
+        text = self.preview_text.get("1.0", "end-1c")
+        
+        header_ranges = []
+        bold_ranges = []
+        for lineno, line in enumerate(text.split("\n"), start=1):
+            if line.startswith("#"):
+                header_ranges += (f"{lineno}.0", f"{lineno}.{len(line)}")
+            else:
+                for match in _MD_BOLD_RE.finditer(line):
+                    bold_ranges += (f"{lineno}.{match.start()}", f"{lineno}.{match.end()}")
+        
+        # One Tcl call per tag regardless of how many spans matched
+        self.preview_text.tag_remove("md_header", "1.0", tk.END)
+        self.preview_text.tag_remove("md_bold", "1.0", tk.END)
+        if header_ranges:
+            self.preview_text.tag_add("md_header", *header_ranges)
+        if bold_ranges:
+            self.preview_text.tag_add("md_bold", *bold_ranges)
+    
+    def _append_preview(self, s):
+        """Append a streamed token to the preview text widget"""
+        self.preview_text.insert(tk.END, s)
+    
+    def cancel_generation(self):
+        """Abort the in-flight AI generation; partial text stays in the preview"""
+        self.generate_cancel.set()
+    
+    def _form_snapshot(self):
+        """Read every form input exactly once into a plain dict.
+
+        StringVars may only be touched on the Tk thread; the snapshot is a
+        plain dict that can be handed to worker threads safely."""
+        form = {key: var.get().strip() for key, var in (
+            ("name", self.name_var),
+            ("job_role", self.job_role_var),
+            ("email", self.email_var),
+            ("phone", self.phone_var),
+            ("location", self.location_var),
+        )}
+        
+        linkedin = self.linkedin_var.get().strip()
+        website = self.website_var.get().strip()
+        links = ""
+        if linkedin:
+            links += f"LinkedIn: {linkedin}\n"
+        if website:
+            links += f"Website: {website}\n"
+        form["links"] = links
+        
+        form["skills"] = self.skills_text.get("1.0", tk.END).strip()
+        form["experience"] = self.experience_text.get("1.0", tk.END).strip()
+        form["education"] = self.education_text.get("1.0", tk.END).strip()
+        form["template"] = self.template_var.get()
+        return form
+    
     def generate_resume(self):
         """Generate a resume based on the form data"""
-        try:
-            # Get form data
-            name = self.name_var.get().strip()
-            job_role = self.job_role_var.get().strip()
-            email = self.email_var.get().strip()
-            phone = self.phone_var.get().strip()
-            location = self.location_var.get().strip()
-            
-            # Validate required fields
-            if not name or not job_role:
-                messagebox.showerror("Error", "Name and Job Role are required fields")
-                return
-            
-            # Get skills, experience, and education
-            skills = self.skills_text.get("1.0", tk.END).strip()
-            experience = self.experience_text.get("1.0", tk.END).strip()
-            education = self.education_text.get("1.0", tk.END).strip()
-            
-            # Get links
-            links = ""
-            if self.linkedin_var.get().strip():
-                links += f"LinkedIn: {self.linkedin_var.get().strip()}\n"
-            if self.website_var.get().strip():
-                links += f"Website: {self.website_var.get().strip()}\n"
-            
-            # Update status
-            self.status_var.set("Generating resume...")
-            self.root.update_idletasks()
-            
-            # Try to generate with AI first
+        form_data = self._form_snapshot()
+        
+        # Validate required fields
+        if not form_data["name"] or not form_data["job_role"]:
+            messagebox.showerror("Error", "Name and Job Role are required fields")
+            return
+        
+        # Update status and surface backpressure while the worker runs
+        self.status_var.set("Generating resume...")
+        self.generate_button.state(["disabled"])
+        self.generate_cancel.clear()
+        self.preview_text.delete("1.0", tk.END)
+        
+        # Run generation on the worker pool; the Tk thread stays free to
+        # paint streamed tokens and handle the Stop button
+        future = self.executor.submit(self._do_generate, form_data)
+        future.add_done_callback(
+            lambda f: self.root.after(0, self._on_generated, f, form_data))
+    
+    def _do_generate(self, form_data):
+        """Produce the resume text on a worker thread (AI with fallback)"""
+        args = (form_data["name"], form_data["job_role"], form_data["skills"],
+                form_data["experience"], form_data["education"], form_data["email"],
+                form_data["phone"], form_data["location"], form_data["links"])
+        
+        with self.generate_sem:
             try:
                 if check_ollama_connection() and REQUESTS_AVAILABLE:
-                    self.resume_text = generate_resume_with_ai(
-                        name, job_role, skills, experience, education, 
-                        email, phone, location, links
-                    )
-                else:
-                    # Fall back to template
-                    template_name = self.template_var.get()
-                    self.resume_text = format_resume_from_template(
-                        name, job_role, skills, experience, education,
-                        email, phone, location, links, template_name
+                    # Stream tokens into the preview as they arrive
+                    return generate_resume_with_ai(
+                        *args,
+                        on_token=lambda t: self.root.after(0, self._append_preview, t),
+                        cancel_event=self.generate_cancel
                     )
-            except Exception as e:
+                return format_resume_from_template(*args, form_data["template"])
+            except Exception:
                 # Fall back to template on error
-                template_name = self.template_var.get()
-                self.resume_text = format_resume_from_template(
-                    name, job_role, skills, experience, education,
-                    email, phone, location, links, template_name
-                )
-            
-            # Update preview
-            self.preview_text.delete("1.0", tk.END)
-            self.preview_text.insert(tk.END, self.resume_text)
-            
-            # Generate QR code if requested
-            if self.qr_var.get() and QR_AVAILABLE:
-                self.generate_qr_code()
-            
-            # Save to history
-            resume_data = {
-                "name": name,
-                "job_role": job_role,
-                "skills": skills,
-                "experience": experience,
-                "education": education,
-                "email": email,
-                "phone": phone,
-                "location": location,
-                "links": links,
-                "template": self.template_var.get(),
-                "resume_text": self.resume_text
-            }
-            save_resume_to_history(resume_data)
-            
-            # Calculate ATS score if enhancer is available
-            if TEXT_ENHANCER_AVAILABLE:
-                self.calculate_ats_score()
-            
-            # Update status
-            self.status_var.set("Resume generated successfully")
+                return format_resume_from_template(*args, form_data["template"])
+    
+    def _on_generated(self, future, form_data):
+        """Finish a generation back on the Tk thread"""
+        self.generate_button.state(["!disabled"])
         
+        try:
+            self.resume_text = future.result()
         except Exception as e:
             self.status_var.set(f"Error: {str(e)}")
             messagebox.showerror("Error", f"Failed to generate resume: {str(e)}")
+            return
+        
+        # Update preview
+        self._patch_text_widget(self.preview_text, self.resume_text)
+        self._style_preview()
+        
+        # Generate QR code if requested
+        if self.qr_var.get() and QR_AVAILABLE:
+            self.generate_qr_code()
+        
+        # Save to history
+        resume_data = dict(form_data, resume_text=self.resume_text)
+        save_resume_to_history(resume_data)
+        
+        # Score the resume once the preview has painted; ATS scoring walks
+        # the whole text and doesn't need to delay the visible update
+        if TEXT_ENHANCER_AVAILABLE:
+            self.root.after_idle(self.calculate_ats_score)
+        
+        # Update status
+        self.status_var.set("Resume generated successfully")
     
     def generate_qr_code(self):
         """Generate QR code for LinkedIn or website URL"""
@@ -1152,17 +1632,10 @@ For more information, visit the help documentation.
             if not url:
                 return
             
-            # Generate QR code
+            # Generate QR code (cached per url/name, so repeat generates
+            # with an unchanged link skip the rasterization entirely)
             name = self.name_var.get().strip()
-            
-            if name and "linkedin.com" in url.lower():
-                # Use LinkedIn themed QR code if it's a LinkedIn URL
-                qr_file = qr_generator.generate_qr_with_linkedin_template(
-                    url, name
-                )
-            else:
-                # Use standard QR code
-                qr_file = qr_generator.generate_qr_code(url)
+            qr_file = _render_qr(url, name, bool(name and "linkedin.com" in url.lower()))
             
             # Show message with QR code path
             if not qr_file.startswith("Error"):
@@ -1197,27 +1670,46 @@ For more information, visit the help documentation.
             if not filename:
                 return
             
-            # Export resume
+            # Render on the worker pool: PDF/DOCX generation can take
+            # seconds and shouldn't freeze the window
             dark_mode = self.dark_mode_var.get()
+            self.status_var.set(f"Exporting as {format_type.upper()}...")
             
-            if format_type == "html" and EXPORT_AVAILABLE:
-                result = resume_export.save_as_html(self.resume_text, filename, dark_mode)
-            else:
-                result = export_resume(self.resume_text, format_type, filename)
-            
-            # Show success message
-            if not result.startswith("Error"):
-                self.status_var.set(f"Resume exported as {format_type.upper()}")
-                
-                # Ask if user wants to open the file
-                if messagebox.askyesno("Export Complete", 
-                                      f"Resume exported to {filename}\n\nOpen file?"):
-                    webbrowser.open(result)
+            future = self.executor.submit(
+                self._do_export, format_type, filename, dark_mode)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._on_exported, f, format_type, filename))
         
         except Exception as e:
             self.status_var.set(f"Export error: {str(e)}")
             messagebox.showerror("Export Error", str(e))
     
+    def _do_export(self, format_type, filename, dark_mode):
+        """Render and write the export file off the Tk thread"""
+        if format_type == "html" and EXPORT_AVAILABLE:
+            return _lazy("resume_export").save_as_html(self.resume_text, filename, dark_mode)
+        return export_resume(self.resume_text, format_type, filename)
+    
+    def _on_exported(self, future, format_type, filename):
+        """Report the export result back on the Tk thread"""
+        try:
+            result = future.result()
+        except Exception as e:
+            self.status_var.set(f"Export error: {str(e)}")
+            messagebox.showerror("Export Error", str(e))
+            return
+        
+        if not result.startswith("Error"):
+            self.status_var.set(f"Resume exported as {format_type.upper()}")
+            
+            # Ask if user wants to open the file
+            if messagebox.askyesno("Export Complete", 
+                                  f"Resume exported to {filename}\n\nOpen file?"):
+                webbrowser.open(result)
+        else:
+            self.status_var.set(result)
+            messagebox.showerror("Export Error", result)
+    
     def check_spelling(self):
         """Check spelling in the resume"""
         if not TEXT_ENHANCER_AVAILABLE:
@@ -1230,7 +1722,7 @@ For more information, visit the help documentation.
         
         try:
             # Check spelling
-            corrected_text, corrections = text_enhancer.check_spelling(self.resume_text)
+            corrected_text, corrections = _lazy("text_enhancer").check_spelling(self.resume_text)
             
             if not corrections:
                 messagebox.showinfo("Spell Check", "No spelling errors found")
@@ -1247,17 +1739,16 @@ For more information, visit the help documentation.
             ModernWidget.style_text(corrections_text)
             corrections_text.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
             
-            # Add header
-            corrections_text.insert(tk.END, "Spelling Corrections:\n\n")
-            
-            # Add each correction
-            for mistake, correction in corrections:
-                corrections_text.insert(tk.END, f"'{mistake}' should be '{correction}'\n")
+            # Header and corrections built as one string: a single insert
+            # means one widget relayout instead of one per correction
+            corrections_text.insert(tk.END, "Spelling Corrections:\n\n" + "".join(
+                f"'{mistake}' should be '{correction}'\n"
+                for mistake, correction in corrections))
             
             # Add apply button
-            apply_button = tk.Button(corrections_window, text="Apply Corrections", 
-                                  command=lambda: self.apply_spelling_corrections(corrected_text))
-            ModernWidget.style_button(apply_button)
+            apply_button = ttk.Button(corrections_window, text="Apply Corrections", 
+                                    command=lambda: self.apply_spelling_corrections(corrected_text),
+                                    style="Modern.TButton")
             apply_button.pack(pady=10)
         
         except Exception as e:
@@ -1268,10 +1759,15 @@ For more information, visit the help documentation.
         if not self.resume_text:
             return
         
-        # Update resume text and preview
+        # Nothing actually changed; skip the widget work
+        if corrected_text == self.resume_text:
+            self.status_var.set("No spelling changes to apply")
+            return
+        
+        # Update resume text and preview; corrections touch a handful of
+        # lines, so patch just those
         self.resume_text = corrected_text
-        self.preview_text.delete("1.0", tk.END)
-        self.preview_text.insert(tk.END, self.resume_text)
+        self._patch_text_widget(self.preview_text, self.resume_text)
         
         # Update status
         self.status_var.set("Spelling corrections applied")
@@ -1289,7 +1785,7 @@ For more information, visit the help documentation.
         try:
             # Update status
             self.status_var.set("Enhancing resume text...")
-            self.root.update_idletasks()
+            self._pulse()
             
             # Get job role for context
             job_role = self.job_role_var.get().strip()
@@ -1299,12 +1795,12 @@ For more information, visit the help documentation.
                 try:
                     # Try to use AI enhancement
                     if check_ollama_connection() and REQUESTS_AVAILABLE:
-                        enhanced_text, explanation = text_enhancer.enhance_with_ai(
+                        enhanced_text, explanation = _lazy("text_enhancer").enhance_with_ai(
                             self.resume_text, job_role
                         )
                     else:
                         # Fall back to basic enhancement
-                        enhanced_text, enhancements = text_enhancer.enhance_text(self.resume_text)
+                        enhanced_text, enhancements = _lazy("text_enhancer").enhance_text(self.resume_text)
                         explanation = "Text enhanced with stronger language and improved clarity."
                     
                     # Update resume text and preview
@@ -1327,11 +1823,15 @@ For more information, visit the help documentation.
     
     def update_preview_with_enhanced_text(self, enhanced_text, explanation):
         """Update preview with enhanced text (called from main thread)"""
-        self.preview_text.delete("1.0", tk.END)
-        self.preview_text.insert(tk.END, enhanced_text)
+        # A no-op enhancement costs nothing
+        if enhanced_text == self.resume_text:
+            self.status_var.set("No changes from enhancement")
+            return
+        
+        self._patch_text_widget(self.preview_text, enhanced_text)
         
-        # Calculate ATS score
-        self.calculate_ats_score()
+        # Calculate ATS score once the preview repaint has gone through
+        self.root.after_idle(self.calculate_ats_score)
         
         # Show explanation
         messagebox.showinfo("Text Enhanced", explanation)
@@ -1346,21 +1846,14 @@ For more information, visit the help documentation.
         
         try:
             # Calculate score
-            score_results = text_enhancer.calculate_ats_score(self.resume_text)
+            score_results = _lazy("text_enhancer").calculate_ats_score(self.resume_text)
             
             # Extract relevant information
             overall_score = score_results.get('overall', 0)
             
-            # Determine rating
-            if overall_score >= 85:
-                rating = "Excellent"
-            elif overall_score >= 70:
-                rating = "Good"
-            elif overall_score >= 50:
-                rating = "Average"
-            else:
-                rating = "Needs Improvement"
-                
+            # Determine rating from the threshold table
+            rating = _ATS_LABELS[bisect.bisect_right(_ATS_THRESHOLDS, overall_score)]
+            
             # Update score display
             self.ats_score_var.set(f"ATS Score: {overall_score} - {rating}")
             
@@ -5,11 +5,188 @@ Handles importing data from LinkedIn profile exports
 
 import json
 import csv
+import copy
+import functools
 import os
 import re
 import datetime
 from collections import defaultdict
 
+# Optional streaming JSON parser; large exports are walked incrementally
+# instead of materializing the whole tree
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Optional fast JSON parser for the non-streaming path
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional native CSV reader for large exports
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+# LinkedIn exports mix several date spellings; one precompiled pattern
+# per shape, all anchored
+_DATE_SLASH_RE = re.compile(r'^(\d{1,2})/(\d{4})$')     # 01/2019
+_DATE_ISO_RE = re.compile(r'^(\d{4})-(\d{1,2})$')       # 2019-03
+_DATE_YEAR_RE = re.compile(r'^(\d{4})$')                 # 2019
+_DATE_TEXT_RE = re.compile(r'^([A-Za-z]{3,9}) (\d{4})$')  # Jan 2019
+
+_MONTH_NUMBERS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+def _parse_date(value, default_month):
+    """Parse one LinkedIn date string into (year, month)
+
+    Args:
+        value: Date string in MM/YYYY, YYYY-MM, YYYY or 'Mon YYYY' form
+        default_month: Month to assume for bare-year dates
+        
+    Returns:
+        tuple: (year, month) ints, or None if the string has no known shape
+    """
+    m = _DATE_SLASH_RE.match(value)
+    if m:
+        return int(m[2]), int(m[1])
+    m = _DATE_YEAR_RE.match(value)
+    if m:
+        return int(m[1]), default_month
+    m = _DATE_ISO_RE.match(value)
+    if m:
+        return int(m[1]), int(m[2])
+    m = _DATE_TEXT_RE.match(value)
+    if m:
+        month = _MONTH_NUMBERS.get(m[1][:3].lower())
+        if month:
+            return int(m[2]), month
+    return None
+
+def _empty_profile():
+    """Fresh profile data structure shared by all parsers"""
+    return {
+        'name': '',
+        'job_role': '',
+        'summary': '',
+        'location': '',
+        'skills': [],
+        'experience': [],
+        'education': [],
+        'contact_info': {},
+        'years_experience': 0
+    }
+
+def _job_from_position(position):
+    """Build one experience entry from a LinkedIn position record"""
+    job = {
+        'title': position.get('title', ''),
+        'company': position.get('companyName', ''),
+        'description': position.get('description', ''),
+        'start_date': '',
+        'end_date': '',
+        'duration': ''
+    }
+
+    # Format dates
+    if 'startDate' in position:
+        start_date = position['startDate']
+        job['start_date'] = f"{start_date.get('month', '')}/{start_date.get('year', '')}"
+
+    if 'endDate' in position:
+        end_date = position['endDate']
+        job['end_date'] = f"{end_date.get('month', '')}/{end_date.get('year', '')}"
+    else:
+        job['end_date'] = 'Present'
+
+    # Duration
+    if 'durationInMonths' in position:
+        months = position['durationInMonths']
+        years = months // 12
+        remaining_months = months % 12
+
+        if years > 0:
+            job['duration'] = f"{years} year{'s' if years > 1 else ''}"
+            if remaining_months > 0:
+                job['duration'] += f", {remaining_months} month{'s' if remaining_months > 1 else ''}"
+        else:
+            job['duration'] = f"{remaining_months} month{'s' if remaining_months > 1 else ''}"
+
+    return job
+
+def _education_from_entry(edu):
+    """Build one education entry from a LinkedIn education record"""
+    education = {
+        'school': edu.get('schoolName', ''),
+        'degree': edu.get('degreeName', ''),
+        'field': edu.get('fieldOfStudy', ''),
+        'start_date': '',
+        'end_date': ''
+    }
+
+    # Format dates
+    if 'startDate' in edu and 'year' in edu['startDate']:
+        education['start_date'] = str(edu['startDate']['year'])
+
+    if 'endDate' in edu and 'year' in edu['endDate']:
+        education['end_date'] = str(edu['endDate']['year'])
+
+    return education
+
+def _apply_profile_section(profile, profile_data):
+    """Fill name, role, summary, location and contact info from the
+    export's profile section"""
+    # Each field is looked up once and bound to a local
+    first_name = profile_data.get('firstName')
+    last_name = profile_data.get('lastName')
+    if first_name is not None and last_name is not None:
+        profile['name'] = f"{first_name} {last_name}".strip()
+
+    # Current job role
+    headline = profile_data.get('headline')
+    if headline is not None:
+        profile['job_role'] = headline
+
+    # Summary
+    summary = profile_data.get('summary')
+    if summary is not None:
+        profile['summary'] = summary
+
+    # Location
+    geo_location = profile_data.get('geoLocation')
+    if geo_location and 'name' in geo_location:
+        profile['location'] = geo_location['name']
+    else:
+        location_name = profile_data.get('locationName')
+        if location_name is not None:
+            profile['location'] = location_name
+
+    # Contact info
+    contact_info = {}
+    phone_numbers = profile_data.get('phoneNumbers')
+    if phone_numbers:
+        # Just take the first one
+        contact_info['phone'] = phone_numbers[0].get('number', '')
+
+    email = profile_data.get('emailAddress')
+    if email is not None:
+        contact_info['email'] = email
+
+    websites = [w['url'] for w in profile_data.get('websites', ()) if 'url' in w]
+    if websites:
+        contact_info['websites'] = websites
+
+    profile['contact_info'] = contact_info
+
 def parse_linkedin_json(file_path):
     """
     Parse LinkedIn profile data from a JSON export file
@@ -21,132 +198,56 @@ def parse_linkedin_json(file_path):
         dict: Structured LinkedIn profile data
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Initialize profile data structure
-        profile = {
-            'name': '',
-            'job_role': '',
-            'summary': '',
-            'location': '',
-            'skills': [],
-            'experience': [],
-            'education': [],
-            'contact_info': {},
-            'years_experience': 0
-        }
+        profile = _empty_profile()
         
-        # Extract basic profile info
-        if 'profile' in data:
-            profile_data = data['profile']
+        if IJSON_AVAILABLE:
+            # Walk only the prefixes we use; the rest of the export never
+            # becomes Python objects
+            with open(file_path, 'rb') as f:
+                profile['skills'] = [
+                    s['name'] for s in ijson.items(f, 'skills.item')
+                    if s.get('name')
+                ]
             
-            # Name
-            if 'firstName' in profile_data and 'lastName' in profile_data:
-                profile['name'] = f"{profile_data.get('firstName', '')} {profile_data.get('lastName', '')}".strip()
+            with open(file_path, 'rb') as f:
+                profile['experience'] = [
+                    _job_from_position(p)
+                    for p in ijson.items(f, 'positions.item')
+                ]
             
-            # Current job role
-            if 'headline' in profile_data:
-                profile['job_role'] = profile_data.get('headline', '')
+            with open(file_path, 'rb') as f:
+                profile['education'] = [
+                    _education_from_entry(e)
+                    for e in ijson.items(f, 'education.item')
+                ]
             
-            # Summary
-            if 'summary' in profile_data:
-                profile['summary'] = profile_data.get('summary', '')
-            
-            # Location
-            if 'geoLocation' in profile_data and 'name' in profile_data['geoLocation']:
-                profile['location'] = profile_data['geoLocation']['name']
-            elif 'locationName' in profile_data:
-                profile['location'] = profile_data.get('locationName', '')
-        
-        # Extract skills
-        if 'skills' in data:
-            for skill in data['skills']:
-                skill_name = skill.get('name', '')
-                if skill_name:
-                    profile['skills'].append(skill_name)
-        
-        # Extract experience
-        if 'positions' in data:
-            for position in data['positions']:
-                job = {
-                    'title': position.get('title', ''),
-                    'company': position.get('companyName', ''),
-                    'description': position.get('description', ''),
-                    'start_date': '',
-                    'end_date': '',
-                    'duration': ''
-                }
-                
-                # Format dates
-                if 'startDate' in position:
-                    start_date = position['startDate']
-                    job['start_date'] = f"{start_date.get('month', '')}/{start_date.get('year', '')}"
-                
-                if 'endDate' in position:
-                    end_date = position['endDate']
-                    job['end_date'] = f"{end_date.get('month', '')}/{end_date.get('year', '')}"
-                else:
-                    job['end_date'] = 'Present'
-                
-                # Duration
-                if 'durationInMonths' in position:
-                    months = position['durationInMonths']
-                    years = months // 12
-                    remaining_months = months % 12
-                    
-                    if years > 0:
-                        job['duration'] = f"{years} year{'s' if years > 1 else ''}"
-                        if remaining_months > 0:
-                            job['duration'] += f", {remaining_months} month{'s' if remaining_months > 1 else ''}"
-                    else:
-                        job['duration'] = f"{remaining_months} month{'s' if remaining_months > 1 else ''}"
-                
-                profile['experience'].append(job)
-        
-        # Extract education
-        if 'education' in data:
-            for edu in data['education']:
-                education = {
-                    'school': edu.get('schoolName', ''),
-                    'degree': edu.get('degreeName', ''),
-                    'field': edu.get('fieldOfStudy', ''),
-                    'start_date': '',
-                    'end_date': ''
-                }
-                
-                # Format dates
-                if 'startDate' in edu and 'year' in edu['startDate']:
-                    education['start_date'] = str(edu['startDate']['year'])
-                
-                if 'endDate' in edu and 'year' in edu['endDate']:
-                    education['end_date'] = str(edu['endDate']['year'])
-                
-                profile['education'].append(education)
-        
-        # Extract contact info
-        if 'profile' in data:
-            profile_data = data['profile']
-            
-            contact_info = {}
-            if 'phoneNumbers' in profile_data:
-                for phone in profile_data['phoneNumbers']:
-                    contact_info['phone'] = phone.get('number', '')
-                    break  # Just take the first one
-            
-            if 'emailAddress' in profile_data:
-                contact_info['email'] = profile_data['emailAddress']
+            with open(file_path, 'rb') as f:
+                profile_data = next(ijson.items(f, 'profile'), None)
+            if profile_data:
+                _apply_profile_section(profile, profile_data)
+        else:
+            if ORJSON_AVAILABLE:
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
             
-            if 'websites' in profile_data:
-                websites = []
-                for website in profile_data['websites']:
-                    if 'url' in website:
-                        websites.append(website['url'])
-                
-                if websites:
-                    contact_info['websites'] = websites
+            # Extract skills, experience and education in C-level
+            # comprehensions
+            profile['skills'] = [
+                s['name'] for s in data.get('skills') or () if s.get('name')
+            ]
+            profile['experience'] = [
+                _job_from_position(p) for p in data.get('positions') or ()
+            ]
+            profile['education'] = [
+                _education_from_entry(e) for e in data.get('education') or ()
+            ]
             
-            profile['contact_info'] = contact_info
+            # Extract basic profile and contact info
+            if 'profile' in data:
+                _apply_profile_section(profile, data['profile'])
         
         # Calculate total years of experience
         profile['years_experience'] = extract_years_of_experience(profile['experience'])
@@ -183,120 +284,31 @@ def parse_linkedin_csv(file_path):
             'years_experience': 0
         }
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            csv_reader = csv.reader(f)
-            headers = next(csv_reader)  # Read headers
-            
-            # Check file type based on headers
-            if 'First Name' in headers and 'Last Name' in headers:
-                # Profile information
-                row = next(csv_reader, None)  # Get the first data row
-                if row:
-                    first_name_idx = headers.index('First Name')
-                    last_name_idx = headers.index('Last Name')
-                    profile['name'] = f"{row[first_name_idx]} {row[last_name_idx]}".strip()
-                    
-                    # Current position
-                    if 'Headline' in headers:
-                        headline_idx = headers.index('Headline')
-                        profile['job_role'] = row[headline_idx]
-                    
-                    # Summary
-                    if 'Summary' in headers:
-                        summary_idx = headers.index('Summary')
-                        profile['summary'] = row[summary_idx]
-                    
-                    # Location
-                    if 'Location' in headers:
-                        location_idx = headers.index('Location')
-                        profile['location'] = row[location_idx]
-                    
-                    # Contact info
-                    contact_info = {}
-                    if 'Email Address' in headers:
-                        email_idx = headers.index('Email Address')
-                        contact_info['email'] = row[email_idx]
-                    
-                    if 'Phone Numbers' in headers:
-                        phone_idx = headers.index('Phone Numbers')
-                        contact_info['phone'] = row[phone_idx]
-                    
-                    profile['contact_info'] = contact_info
-            
-            elif 'Company Name' in headers and 'Title' in headers:
-                # Experience information
-                for row in csv_reader:
-                    if not row or not any(row):  # Skip empty rows
-                        continue
-                    
-                    company_idx = headers.index('Company Name')
-                    title_idx = headers.index('Title')
-                    
-                    job = {
-                        'company': row[company_idx],
-                        'title': row[title_idx],
-                        'description': '',
-                        'start_date': '',
-                        'end_date': '',
-                        'duration': ''
-                    }
-                    
-                    # Description
-                    if 'Description' in headers:
-                        desc_idx = headers.index('Description')
-                        job['description'] = row[desc_idx]
-                    
-                    # Dates
-                    if 'Started On' in headers:
-                        start_idx = headers.index('Started On')
-                        job['start_date'] = row[start_idx]
-                    
-                    if 'Finished On' in headers:
-                        end_idx = headers.index('Finished On')
-                        job['end_date'] = row[end_idx] if row[end_idx] else 'Present'
-                    
-                    profile['experience'].append(job)
-            
-            elif 'School Name' in headers and 'Degree Name' in headers:
-                # Education information
-                for row in csv_reader:
-                    if not row or not any(row):  # Skip empty rows
-                        continue
-                    
-                    school_idx = headers.index('School Name')
-                    degree_idx = headers.index('Degree Name')
-                    
-                    education = {
-                        'school': row[school_idx],
-                        'degree': row[degree_idx],
-                        'field': '',
-                        'start_date': '',
-                        'end_date': ''
-                    }
-                    
-                    # Field of study
-                    if 'Field of Study' in headers:
-                        field_idx = headers.index('Field of Study')
-                        education['field'] = row[field_idx]
-                    
-                    # Dates
-                    if 'Started On' in headers:
-                        start_idx = headers.index('Started On')
-                        education['start_date'] = row[start_idx]
-                    
-                    if 'Finished On' in headers:
-                        end_idx = headers.index('Finished On')
-                        education['end_date'] = row[end_idx]
-                    
-                    profile['education'].append(education)
-            
-            elif 'Skill Name' in headers:
-                # Skills information
-                skill_idx = headers.index('Skill Name')
-                for row in csv_reader:
-                    if not row or not any(row):  # Skip empty rows
-                        continue
-                    profile['skills'].append(row[skill_idx])
+        if POLARS_AVAILABLE:
+            # Native multithreaded CSV parser; keep every column as text
+            lf = pl.scan_csv(file_path, infer_schema_length=0)
+            cols = lf.collect_schema().names()
+            if ('Skill Name' in cols
+                    and not ('First Name' in cols and 'Last Name' in cols)
+                    and not ('Company Name' in cols and 'Title' in cols)
+                    and not ('School Name' in cols and 'Degree Name' in cols)):
+                # Skills files carry one useful column; projection
+                # pushdown reads only that column from disk
+                profile['skills'] = (
+                    lf.select('Skill Name')
+                    .filter(pl.col('Skill Name').is_not_null())
+                    .collect()['Skill Name']
+                    .to_list()
+                )
+            else:
+                # Blank out nulls so rows look like csv.reader output
+                df = lf.collect().fill_null('')
+                _fill_profile_from_csv(profile, df.columns, df.iter_rows())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                csv_reader = csv.reader(f)
+                headers = next(csv_reader)  # Read headers
+                _fill_profile_from_csv(profile, headers, csv_reader)
         
         # Calculate total years of experience if we have experience data
         if profile['experience']:
@@ -307,6 +319,164 @@ def parse_linkedin_csv(file_path):
     except Exception as e:
         raise Exception(f"Error parsing LinkedIn CSV: {str(e)}")
 
+def _finish_experience_row(job):
+    """Per-row fixups the experience schema can't express declaratively"""
+    job['duration'] = ''
+    if not job['end_date']:
+        job['end_date'] = 'Present'
+
+# Row-per-entry CSV shapes: required headers, target profile list,
+# output field -> column name, optional per-row fixup
+_CSV_SCHEMAS = [
+    ({'Company Name', 'Title'}, 'experience',
+     {'company': 'Company Name', 'title': 'Title',
+      'description': 'Description', 'start_date': 'Started On',
+      'end_date': 'Finished On'},
+     _finish_experience_row),
+    ({'School Name', 'Degree Name'}, 'education',
+     {'school': 'School Name', 'degree': 'Degree Name',
+      'field': 'Field of Study', 'start_date': 'Started On',
+      'end_date': 'Finished On'},
+     None),
+]
+
+def _fill_profile_from_csv(profile, headers, rows):
+    """Populate profile fields from one LinkedIn CSV export
+
+    Args:
+        profile: Profile data structure to fill in place
+        headers: List of column names from the header row
+        rows: Iterable of data rows (sequences aligned with headers)
+    """
+    hidx = {h: i for i, h in enumerate(headers)}
+    
+    # Profile-information files carry a single row plus contact fields
+    if 'First Name' in hidx and 'Last Name' in hidx:
+        row = next(iter(rows), None)  # Get the first data row
+        if row:
+            profile['name'] = f"{row[hidx['First Name']]} {row[hidx['Last Name']]}".strip()
+            
+            # Current position
+            if 'Headline' in hidx:
+                profile['job_role'] = row[hidx['Headline']]
+            
+            # Summary
+            if 'Summary' in hidx:
+                profile['summary'] = row[hidx['Summary']]
+            
+            # Location
+            if 'Location' in hidx:
+                profile['location'] = row[hidx['Location']]
+            
+            # Contact info
+            contact_info = {}
+            if 'Email Address' in hidx:
+                contact_info['email'] = row[hidx['Email Address']]
+            
+            if 'Phone Numbers' in hidx:
+                contact_info['phone'] = row[hidx['Phone Numbers']]
+            
+            profile['contact_info'] = contact_info
+        return
+    
+    # Row-per-entry files match a declared schema; column indices are
+    # resolved once, so the row loop is plain tuple indexing
+    for required, target, field_map, finish_row in _CSV_SCHEMAS:
+        if required <= hidx.keys():
+            columns = [(field, hidx.get(col)) for field, col in field_map.items()]
+            append = profile[target].append
+            for row in rows:
+                if not row or not any(row):  # Skip empty rows
+                    continue
+                entry = {
+                    field: (row[i] if i is not None else '')
+                    for field, i in columns
+                }
+                if finish_row is not None:
+                    finish_row(entry)
+                append(entry)
+            return
+    
+    # Skills files: one column collected as a flat list
+    if 'Skill Name' in hidx:
+        skill_idx = hidx['Skill Name']
+        for row in rows:
+            if not row or not any(row):  # Skip empty rows
+                continue
+            profile['skills'].append(row[skill_idx])
+
+# Extension -> parser dispatch for export files
+_PARSERS = {
+    '.json': parse_linkedin_json,
+    '.csv': parse_linkedin_csv,
+}
+
+@functools.lru_cache(maxsize=32)
+def _parse_cached(file_path, ext, mtime, size):
+    """Parse one export file, memoized on path plus stat fields so an
+    edited file busts its cache entry"""
+    return _PARSERS[ext](file_path)
+
+def _parse_one(file_path):
+    """Parse a single export file, or return None (with a message) for
+    unsupported or unreadable input"""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext not in _PARSERS:
+        print(f"Unsupported file format: {file_path}")
+        return None
+    try:
+        st = os.stat(file_path)
+        # Deep-copy so merging callers never mutate the cached profile
+        return copy.deepcopy(_parse_cached(file_path, ext, st.st_mtime, st.st_size))
+    except Exception as e:
+        # The parsers wrap their own failures in a generic Exception
+        print(f"Error processing file {file_path}: {str(e)}")
+        return None
+
+def _merge_profile(combined_profile, profile, seen_skills, seen_experience,
+                   seen_education):
+    """Merge one parsed profile into the combined result in place"""
+    if not combined_profile['name'] and profile['name']:
+        combined_profile['name'] = profile['name']
+    
+    if not combined_profile['job_role'] and profile['job_role']:
+        combined_profile['job_role'] = profile['job_role']
+    
+    if not combined_profile['summary'] and profile['summary']:
+        combined_profile['summary'] = profile['summary']
+    
+    if not combined_profile['location'] and profile['location']:
+        combined_profile['location'] = profile['location']
+    
+    # Combine skills without duplicates
+    for skill in profile['skills']:
+        if skill not in seen_skills:
+            seen_skills.add(skill)
+            combined_profile['skills'].append(skill)
+    
+    # Combine experience entries
+    for exp in profile['experience']:
+        key = (exp['company'], exp['title'], exp['start_date'], exp['end_date'])
+        if key not in seen_experience:
+            seen_experience.add(key)
+            combined_profile['experience'].append(exp)
+    
+    # Combine education entries
+    for edu in profile['education']:
+        key = (edu['school'], edu['degree'], edu['start_date'], edu['end_date'])
+        if key not in seen_education:
+            seen_education.add(key)
+            combined_profile['education'].append(edu)
+    
+    # Combine contact info
+    for key, value in profile['contact_info'].items():
+        if key not in combined_profile['contact_info']:
+            combined_profile['contact_info'][key] = value
+    
+    # Update years of experience if the new value is greater
+    if profile['years_experience'] > combined_profile['years_experience']:
+        combined_profile['years_experience'] = profile['years_experience']
+
 def combine_profile_data(file_paths):
     """
     Combine data from multiple LinkedIn export files
@@ -317,71 +487,32 @@ def combine_profile_data(file_paths):
     Returns:
         dict: Combined LinkedIn profile data
     """
-    combined_profile = {
-        'name': '',
-        'job_role': '',
-        'summary': '',
-        'location': '',
-        'skills': [],
-        'experience': [],
-        'education': [],
-        'contact_info': {},
-        'years_experience': 0
-    }
+    combined_profile = _empty_profile()
+    
+    # Membership sets so merging stays linear in the total item count
+    seen_skills = set()
+    seen_experience = set()
+    seen_education = set()
     
     for file_path in file_paths:
-        try:
-            # Parse the file based on extension
-            if file_path.lower().endswith('.json'):
-                profile = parse_linkedin_json(file_path)
-            elif file_path.lower().endswith('.csv'):
-                profile = parse_linkedin_csv(file_path)
-            else:
-                print(f"Unsupported file format: {file_path}")
-                continue
-            
-            # Merge data
-            if not combined_profile['name'] and profile['name']:
-                combined_profile['name'] = profile['name']
-            
-            if not combined_profile['job_role'] and profile['job_role']:
-                combined_profile['job_role'] = profile['job_role']
-            
-            if not combined_profile['summary'] and profile['summary']:
-                combined_profile['summary'] = profile['summary']
-            
-            if not combined_profile['location'] and profile['location']:
-                combined_profile['location'] = profile['location']
-            
-            # Combine skills without duplicates
-            for skill in profile['skills']:
-                if skill not in combined_profile['skills']:
-                    combined_profile['skills'].append(skill)
-            
-            # Combine experience entries
-            for exp in profile['experience']:
-                if exp not in combined_profile['experience']:
-                    combined_profile['experience'].append(exp)
-            
-            # Combine education entries
-            for edu in profile['education']:
-                if edu not in combined_profile['education']:
-                    combined_profile['education'].append(edu)
-            
-            # Combine contact info
-            for key, value in profile['contact_info'].items():
-                if key not in combined_profile['contact_info']:
-                    combined_profile['contact_info'][key] = value
-            
-            # Update years of experience if the new value is greater
-            if profile['years_experience'] > combined_profile['years_experience']:
-                combined_profile['years_experience'] = profile['years_experience']
-        
-        except Exception as e:
-            print(f"Error processing file {file_path}: {str(e)}")
+        profile = _parse_one(file_path)
+        if profile is None:
+            continue
+        _merge_profile(combined_profile, profile, seen_skills,
+                       seen_experience, seen_education)
     
     return combined_profile
 
+def _experience_sort_key(exp):
+    """Uniform (year, month) sort key for an experience entry
+
+    'Present' sorts above any real date; unparseable dates sort last.
+    """
+    end_date = exp['end_date']
+    if end_date == 'Present':
+        return (9999, 12)
+    return _parse_date(end_date, 12) or (0, 0)
+
 def format_experience_for_resume(experiences):
     """
     Format experience data for resume presentation
@@ -396,27 +527,21 @@ def format_experience_for_resume(experiences):
         return ""
     
     # Sort experiences by date (most recent first)
-    sorted_exp = sorted(
-        experiences, 
-        key=lambda x: datetime.datetime.now() if x['end_date'] == 'Present' else 
-            datetime.datetime.strptime(x['end_date'].split('/')[-1], '%Y') 
-            if '/' in x['end_date'] else x['end_date'],
-        reverse=True
-    )
+    sorted_exp = sorted(experiences, key=_experience_sort_key, reverse=True)
     
-    formatted_text = ""
+    parts = []
     for exp in sorted_exp:
         # Format dates
         date_range = f"{exp['start_date']} - {exp['end_date']}"
         
         # Format position
-        formatted_text += f"**{exp['title']}** at *{exp['company']}* ({date_range})\n\n"
+        parts.append(f"**{exp['title']}** at *{exp['company']}* ({date_range})\n\n")
         
         # Add description if available
         if exp['description']:
-            formatted_text += f"{exp['description']}\n\n"
+            parts.append(f"{exp['description']}\n\n")
     
-    return formatted_text
+    return "".join(parts)
 
 def format_education_for_resume(education):
     """
@@ -438,7 +563,7 @@ def format_education_for_resume(education):
         reverse=True
     )
     
-    formatted_text = ""
+    parts = []
     for edu in sorted_edu:
         # Format degree and field
         degree_field = edu['degree']
@@ -450,9 +575,9 @@ def format_education_for_resume(education):
         if edu['start_date'] or edu['end_date']:
             date_range = f" ({edu['start_date']} - {edu['end_date']})"
         
-        formatted_text += f"**{degree_field}** from *{edu['school']}*{date_range}\n\n"
+        parts.append(f"**{degree_field}** from *{edu['school']}*{date_range}\n\n")
     
-    return formatted_text
+    return "".join(parts)
 
 def extract_years_of_experience(experiences):
     """
@@ -464,65 +589,40 @@ def extract_years_of_experience(experiences):
     Returns:
         int: Total years of experience
     """
-    total_months = 0
+    # Parse pass: reduce each entry to (start_year, start_month,
+    # end_year, end_month) ints, dropping anything unparseable
+    now = datetime.datetime.now()
+    now_year, now_month = now.year, now.month
+    spans = []
     
     for exp in experiences:
-        # Handle different date formats
-        try:
-            # Try to get start and end dates
-            start_date = exp.get('start_date', '')
-            end_date = exp.get('end_date', '')
-            
-            # If no dates are available, skip this entry
-            if not start_date:
-                continue
-            
-            # Process start date
-            if '/' in start_date:
-                # Format MM/YYYY
-                start_parts = start_date.split('/')
-                if len(start_parts) == 2:
-                    start_year = int(start_parts[1])
-                    start_month = int(start_parts[0])
-                else:
-                    continue
-            else:
-                # Just year
-                try:
-                    start_year = int(start_date)
-                    start_month = 1  # Default to January
-                except ValueError:
-                    continue
-            
-            # Process end date
-            if end_date == 'Present':
-                # Use current date for "Present"
-                now = datetime.datetime.now()
-                end_year = now.year
-                end_month = now.month
-            elif '/' in end_date:
-                # Format MM/YYYY
-                end_parts = end_date.split('/')
-                if len(end_parts) == 2:
-                    end_year = int(end_parts[1])
-                    end_month = int(end_parts[0])
-                else:
-                    continue
-            else:
-                # Just year
-                try:
-                    end_year = int(end_date)
-                    end_month = 12  # Default to December
-                except ValueError:
-                    continue
-            
-            # Calculate duration in months
-            duration_months = (end_year - start_year) * 12 + (end_month - start_month + 1)
-            total_months += max(0, duration_months)  # Ensure non-negative
+        start_date = exp.get('start_date', '')
+        end_date = exp.get('end_date', '')
         
-        except Exception:
-            # If there's any error in parsing dates, skip this entry
+        # If no dates are available, skip this entry
+        if not start_date:
             continue
+        
+        # Bare-year start dates default to January
+        start = _parse_date(start_date, 1)
+        if start is None:
+            continue
+        
+        # Bare-year end dates default to December
+        if end_date == 'Present':
+            end = (now_year, now_month)
+        else:
+            end = _parse_date(end_date, 12)
+            if end is None:
+                continue
+        
+        spans.append((start[0], start[1], end[0], end[1]))
+    
+    # Arithmetic pass: pure int math over the parsed spans in one
+    # C-level sum, clamping each duration at zero
+    total_months = sum(
+        max(0, (ey - sy) * 12 + (em - sm + 1)) for sy, sm, ey, em in spans
+    )
     
     # Convert total months to years (rounded down)
     return total_months // 12 
\ No newline at end of file
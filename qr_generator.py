@@ -4,19 +4,41 @@ Handles QR code generation for resume links and LinkedIn profiles
 """
 
 import os
-import random
-import string
+import secrets
 import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Try to import optional dependencies
 try:
     import qrcode
+    import qrcode.image.svg
     from PIL import Image, ImageDraw, ImageFont
     QR_AVAILABLE = True
 except ImportError:
     QR_AVAILABLE = False
 
-def generate_qr_code(data, filename=None, size=10, border=4, logo_path=None):
+_FONT_CACHE = {}
+_FONT_LOCK = threading.Lock()
+
+def _get_font(face, size):
+    """Load a truetype font once and reuse it, falling back to PIL's
+    built-in default when the face is not installed"""
+    key = (face, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        with _FONT_LOCK:
+            font = _FONT_CACHE.get(key)
+            if font is None:
+                try:
+                    font = ImageFont.truetype(face, size)
+                except Exception:
+                    font = ImageFont.load_default()
+                _FONT_CACHE[key] = font
+    return font
+
+def generate_qr_code(data, filename=None, size=10, border=4, logo_path=None,
+                     return_image=False):
     """
     Generate a QR code for the given data
     
@@ -26,16 +48,18 @@ def generate_qr_code(data, filename=None, size=10, border=4, logo_path=None):
         size: Size of each QR code box in pixels
         border: Border size in boxes
         logo_path: Optional path to a logo to place in the center
+        return_image: If True, return the PIL image instead of saving it
         
     Returns:
-        str: Path to the generated QR code image or error message
+        str: Path to the generated QR code image or error message,
+        or the PIL image when return_image is True
     """
     if not QR_AVAILABLE:
         return "Error: QR code generation requires qrcode and Pillow. Install with 'pip install qrcode[pil]'."
     
-    if not filename:
+    if not filename and not return_image:
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        random_str = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
+        random_str = secrets.token_hex(3)
         filename = f"qr_code_{timestamp}_{random_str}.png"
     
     try:
@@ -51,11 +75,19 @@ def generate_qr_code(data, filename=None, size=10, border=4, logo_path=None):
         qr.add_data(data)
         qr.make(fit=True)
         
+        # Vector output needs no raster buffers at all
+        if filename and filename.lower().endswith('.svg') and not logo_path:
+            img = qr.make_image(image_factory=qrcode.image.svg.SvgPathImage)
+            img.save(filename)
+            return os.path.abspath(filename)
+        
         # Create image from QR code
-        img = qr.make_image(fill_color="black", back_color="white").convert('RGBA')
+        img = qr.make_image(fill_color="black", back_color="white")
         
         # If logo path is provided, add logo to center of QR code
         if logo_path and os.path.exists(logo_path):
+            # Alpha channel is only needed while compositing the logo
+            img = img.convert('RGBA')
             try:
                 logo = Image.open(logo_path).convert('RGBA')
                 
@@ -78,8 +110,12 @@ def generate_qr_code(data, filename=None, size=10, border=4, logo_path=None):
             except Exception as e:
                 print(f"Error adding logo to QR code: {str(e)}")
         
-        # Save image
-        img.save(filename)
+        if return_image:
+            return img
+        
+        # Save image; the two-color payload barely benefits from higher
+        # zlib levels, so take the fast compressor path
+        img.save(filename, format='PNG', optimize=False, compress_level=1)
         return os.path.abspath(filename)
     
     except Exception as e:
@@ -105,18 +141,18 @@ def generate_qr_with_linkedin_template(linkedin_url, name=None, filename=None):
         filename = f"linkedin_qr_{timestamp}.png"
     
     try:
-        # Create the QR code
-        qr_code_path = generate_qr_code(
+        # Create the QR code in memory; no temp file round-trip
+        qr_img = generate_qr_code(
             data=linkedin_url,
             size=10,
-            border=4
+            border=4,
+            return_image=True
         )
         
-        if qr_code_path.startswith("Error"):
-            return qr_code_path
+        if isinstance(qr_img, str):
+            return qr_img
         
-        # Open the QR code image
-        qr_img = Image.open(qr_code_path).convert('RGBA')
+        qr_img = qr_img.convert('RGBA')
         
         # Create a new image with space for the LinkedIn logo and name
         width, height = qr_img.size
@@ -131,11 +167,8 @@ def generate_qr_with_linkedin_template(linkedin_url, name=None, filename=None):
             try:
                 draw = ImageDraw.Draw(new_img)
                 
-                # Try to use a nice font, fall back to default if not available
-                try:
-                    font = ImageFont.truetype("arial.ttf", 20)
-                except:
-                    font = ImageFont.load_default()
+                # Cached font; loading parses the font file only once
+                font = _get_font("arial.ttf", 20)
                 
                 # Calculate text position (centered)
                 text_width = draw.textlength(f"Connect with {name} on LinkedIn", font=font)
@@ -151,16 +184,36 @@ def generate_qr_with_linkedin_template(linkedin_url, name=None, filename=None):
             except Exception as e:
                 print(f"Error adding text to QR code: {str(e)}")
         
-        # Save the new image
-        new_img.save(filename)
-        
-        # Delete the temporary QR code image
-        try:
-            os.remove(qr_code_path)
-        except:
-            pass
-        
+        # Save the new image with the same fast PNG settings
+        new_img.save(filename, format='PNG', optimize=False, compress_level=1)
         return os.path.abspath(filename)
     
     except Exception as e:
-        return f"Error generating LinkedIn QR code: {str(e)}" 
\ No newline at end of file
+        return f"Error generating LinkedIn QR code: {str(e)}" 
+def generate_qr_codes_bulk(items, out_dir="."):
+    """
+    Generate LinkedIn QR codes for many people in parallel
+    
+    Reed-Solomon encoding and PNG compression release the GIL inside
+    PIL's C code, so independent codes scale across cores.
+    
+    Args:
+        items: Iterable of (linkedin_url, name) tuples
+        out_dir: Directory to write the images into
+        
+    Returns:
+        list: Per-item results from generate_qr_with_linkedin_template
+        (paths or error messages), in input order
+    """
+    if not QR_AVAILABLE:
+        return ["Error: QR code generation requires qrcode and Pillow. Install with 'pip install qrcode[pil]'."]
+    
+    def _one(item):
+        linkedin_url, name = item
+        filename = os.path.join(
+            out_dir, f"linkedin_qr_{secrets.token_hex(4)}.png")
+        return generate_qr_with_linkedin_template(
+            linkedin_url, name=name, filename=filename)
+    
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(_one, items))
@@ -6,25 +6,80 @@ Handles exporting resumes in different formats like TXT, HTML, DOCX, and PDF
 import os
 import re
 import datetime
+import functools
+import importlib.util
 
-# Try to import optional dependencies
-try:
-    import markdown
-    MARKDOWN_AVAILABLE = True
-except ImportError:
-    MARKDOWN_AVAILABLE = False
+# Inline bold runs for the DOCX exporter, precompiled once
+_BOLD_SPLIT_RE = re.compile(r'(\*\*.*?\*\*)')
+
+# Heading level -> PDF font size
+_PDF_HEADING_SIZES = (16, 14, 12)
+
+def _tok_default(line):
+    """Classify a line that has no special first character"""
+    stripped = line.strip()
+    if not stripped:
+        return ('blank', None)
+    if stripped[0] == '=' and len(stripped) > 10 and not stripped.strip('='):
+        # C-level strip does the all-'=' scan
+        return ('separator', None)
+    return ('text', line)
+
+def _tok_hash(line):
+    # lstrip counts the leading hashes in C; no regex needed
+    hashes = len(line) - len(line.lstrip('#'))
+    if hashes <= 3 and line[hashes:hashes + 1] == ' ':
+        return ('heading', (hashes, line[hashes + 1:]))
+    return _tok_default(line)
 
-try:
-    from fpdf import FPDF
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
+def _tok_star(line):
+    if line.startswith('**') and line.endswith('**'):
+        return ('bold', line.strip('*'))
+    return ('bullet', line[1:].strip())
 
-try:
-    import docx
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+def _tok_dash(line):
+    return ('bullet', line[1:].strip())
+
+# First-character dispatch: one table index replaces the branch cascade
+_TOKEN_DISPATCH = [_tok_default] * 128
+_TOKEN_DISPATCH[ord('#')] = _tok_hash
+_TOKEN_DISPATCH[ord('*')] = _tok_star
+_TOKEN_DISPATCH[ord('-')] = _tok_dash
+
+@functools.lru_cache(maxsize=8)
+def _tokenize(resume_text):
+    """Parse resume markdown once into (kind, payload) tokens
+
+    Both the PDF and DOCX exporters consume this stream, so exporting
+    the same resume to several formats parses it a single time.
+    """
+    tokens = []
+    append = tokens.append
+    dispatch = _TOKEN_DISPATCH
+    for line in resume_text.splitlines():
+        if line:
+            first = ord(line[0])
+            handler = dispatch[first] if first < 128 else _tok_default
+            append(handler(line))
+        else:
+            append(('blank', None))
+    return tuple(tokens)
+
+# Optional dependencies are probed without importing them (find_spec
+# reads metadata only) and imported lazily on first use, so exporting
+# plain text never pays for parsing docx's XML schemas
+MARKDOWN_AVAILABLE = importlib.util.find_spec("markdown") is not None
+PDF_AVAILABLE = importlib.util.find_spec("fpdf") is not None
+DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
+# Preferred PDF backend: reportlab lays text out in C, while fpdf does
+# per-cell metric math in pure Python
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+# HTML-to-PDF backend that reuses the cached markdown render
+WEASYPRINT_AVAILABLE = importlib.util.find_spec("weasyprint") is not None
+
+# Lazily bound docx oxml constructors (see save_as_docx)
+OxmlElement = None
+qn = None
 
 def save_as_text(resume_text, filename="resume.txt"):
     """
@@ -38,51 +93,15 @@ def save_as_text(resume_text, filename="resume.txt"):
         str: Path to the saved file
     """
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(resume_text)
+        # Encode once and write the bytes in a single buffered pass
+        data = resume_text.encode("utf-8")
+        with open(filename, "wb", buffering=1 << 20) as f:
+            f.write(data)
         return os.path.abspath(filename)
     except Exception as e:
         return f"Error saving text file: {str(e)}"
 
-def save_as_html(resume_text, filename="resume.html", dark_mode=False):
-    """
-    Save resume as HTML file
-    
-    Args:
-        resume_text: Resume text content (in markdown format)
-        filename: Output filename
-        dark_mode: Whether to use dark mode styling
-        
-    Returns:
-        str: Path to the saved file
-    """
-    if not MARKDOWN_AVAILABLE:
-        plain_html = f"<pre>{resume_text}</pre>"
-        
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>Resume</title>
-    <meta charset="UTF-8">
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; padding: 20px; }}
-        pre {{ white-space: pre-wrap; }}
-    </style>
-</head>
-<body>
-    {plain_html}
-</body>
-</html>""")
-        return os.path.abspath(filename)
-    
-    try:
-        # Convert markdown to HTML
-        html_content = markdown.markdown(resume_text)
-        
-        # Determine CSS based on mode
-        if dark_mode:
-            css = """
+_DARK_CSS = """
         body {
             font-family: 'Segoe UI', Arial, sans-serif;
             line-height: 1.6;
@@ -112,8 +131,8 @@ def save_as_html(resume_text, filename="resume.html", dark_mode=False):
             color: #e0e0e0;
         }
         """
-        else:
-            css = """
+
+_LIGHT_CSS = """
         body {
             font-family: 'Segoe UI', Arial, sans-serif;
             line-height: 1.6;
@@ -144,9 +163,31 @@ def save_as_html(resume_text, filename="resume.html", dark_mode=False):
             list-style-type: square;
         }
         """
-        
-        # Create full HTML document
-        html_document = f"""<!DOCTYPE html>
+
+# Fallback document written around the raw text when markdown is
+# missing; head and tail bracket one plain f.write of the resume
+_PLAIN_HTML_HEAD = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Resume</title>
+    <meta charset="UTF-8">
+    <style>
+        body { font-family: Arial, sans-serif; line-height: 1.6; padding: 20px; }
+        pre { white-space: pre-wrap; }
+    </style>
+</head>
+<body>
+    <pre>"""
+
+_PLAIN_HTML_TAIL = """</pre>
+</body>
+</html>"""
+
+# The bracketing constants encoded once; the fallback writes bytes
+_PLAIN_HTML_HEAD_BYTES = _PLAIN_HTML_HEAD.encode("utf-8")
+_PLAIN_HTML_TAIL_BYTES = _PLAIN_HTML_TAIL.encode("utf-8")
+
+_HTML_SKELETON = """<!DOCTYPE html>
 <html>
 <head>
     <title>Resume</title>
@@ -156,11 +197,51 @@ def save_as_html(resume_text, filename="resume.html", dark_mode=False):
     </style>
 </head>
 <body>
-    {html_content}
+    {body}
 </body>
 </html>"""
+
+@functools.lru_cache(maxsize=32)
+def _render_body(resume_text):
+    """Markdown to HTML body, shared by the HTML and PDF exporters"""
+    import markdown
+    return markdown.markdown(resume_text)
+
+@functools.lru_cache(maxsize=32)
+def _render_md(resume_text, dark_mode):
+    """Render resume markdown into a full HTML document
+
+    Memoized so repeated exports of the same text skip the markdown
+    parse entirely.
+    """
+    css = _DARK_CSS if dark_mode else _LIGHT_CSS
+    return _HTML_SKELETON.format(css=css, body=_render_body(resume_text))
+
+def save_as_html(resume_text, filename="resume.html", dark_mode=False):
+    """
+    Save resume as HTML file
+    
+    Args:
+        resume_text: Resume text content (in markdown format)
+        filename: Output filename
+        dark_mode: Whether to use dark mode styling
+        
+    Returns:
+        str: Path to the saved file
+    """
+    if not MARKDOWN_AVAILABLE:
+        # Three buffered writes; the skeleton bytes are pre-encoded and
+        # only the resume text goes through the UTF-8 encoder
+        with open(filename, "wb", buffering=1 << 20) as f:
+            f.write(_PLAIN_HTML_HEAD_BYTES)
+            f.write(resume_text.encode("utf-8"))
+            f.write(_PLAIN_HTML_TAIL_BYTES)
+        return os.path.abspath(filename)
+    
+    try:
+        html_document = _render_md(resume_text, dark_mode)
         
-        with open(filename, "w", encoding="utf-8") as f:
+        with open(filename, "w", encoding="utf-8", buffering=1 << 20) as f:
             f.write(html_document)
         
         return os.path.abspath(filename)
@@ -168,6 +249,37 @@ def save_as_html(resume_text, filename="resume.html", dark_mode=False):
     except Exception as e:
         return f"Error saving HTML file: {str(e)}"
 
+def _save_pdf_reportlab(resume_text, filename):
+    """Render the token stream to PDF with reportlab's platypus layout"""
+    from html import escape
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import (SimpleDocTemplate, Paragraph, Spacer,
+                                    HRFlowable)
+    
+    styles = getSampleStyleSheet()
+    heading_styles = (styles['Heading1'], styles['Heading2'], styles['Heading3'])
+    normal = styles['Normal']
+    
+    story = []
+    for kind, payload in _tokenize(resume_text):
+        if kind == 'heading':
+            level, text = payload
+            story.append(Paragraph(escape(text), heading_styles[level - 1]))
+        elif kind == 'bold':
+            story.append(Paragraph(f"<b>{escape(payload)}</b>", normal))
+        elif kind == 'bullet':
+            story.append(Paragraph(escape(payload), normal, bulletText='•'))
+        elif kind == 'blank':
+            story.append(Spacer(1, 6))
+        elif kind == 'separator':
+            story.append(HRFlowable(width='100%'))
+        else:
+            story.append(Paragraph(escape(payload), normal))
+    
+    SimpleDocTemplate(filename, pagesize=A4).build(story)
+    return os.path.abspath(filename)
+
 def save_as_pdf(resume_text, filename="resume.pdf"):
     """
     Save resume as PDF file
@@ -179,52 +291,76 @@ def save_as_pdf(resume_text, filename="resume.pdf"):
     Returns:
         str: Path to the saved file
     """
+    if REPORTLAB_AVAILABLE:
+        try:
+            return _save_pdf_reportlab(resume_text, filename)
+        except Exception as e:
+            return f"Error saving PDF file: {str(e)}"
+    
+    if WEASYPRINT_AVAILABLE and MARKDOWN_AVAILABLE:
+        # Reuses the same cached render as save_as_html
+        try:
+            import weasyprint
+            html = _render_md(resume_text, False)
+            weasyprint.HTML(string=html).write_pdf(filename)
+            return os.path.abspath(filename)
+        except Exception as e:
+            return f"Error saving PDF file: {str(e)}"
+    
     if not PDF_AVAILABLE:
         return f"Error: PDF export requires the fpdf package. Install with 'pip install fpdf'."
     
     try:
         # Create PDF object
+        from fpdf import FPDF
         pdf = FPDF()
         pdf.add_page()
         
         # Set font
         pdf.set_font("Arial", size=12)
         
-        # Process and add text
-        lines = resume_text.split('\n')
-        for line in lines:
-            # Check for heading patterns
-            if line.startswith('# '):
-                pdf.set_font("Arial", 'B', 16)
-                pdf.cell(0, 10, line[2:], ln=True)
-                pdf.set_font("Arial", size=12)
-            elif line.startswith('## '):
-                pdf.set_font("Arial", 'B', 14)
-                pdf.cell(0, 10, line[3:], ln=True)
-                pdf.set_font("Arial", size=12)
-            elif line.startswith('### '):
-                pdf.set_font("Arial", 'B', 12)
-                pdf.cell(0, 10, line[4:], ln=True)
-                pdf.set_font("Arial", size=12)
-            elif line.startswith('**') and line.endswith('**'):
-                # Bold text
-                pdf.set_font("Arial", 'B', 12)
-                pdf.cell(0, 10, line.strip('*'), ln=True)
-                pdf.set_font("Arial", size=12)
-            elif line.startswith('-') or line.startswith('*'):
-                # Bullet point
+        # Render the shared token stream; consecutive regular lines
+        # are buffered and written in one multi_cell call, and the font
+        # is only switched on actual transitions
+        text_buffer = []
+        regular = ("Arial", "", 12)
+        current_font = regular
+        
+        def use_font(spec):
+            nonlocal current_font
+            if spec != current_font:
+                pdf.set_font(*spec)
+                current_font = spec
+        
+        def flush_text():
+            if text_buffer:
+                use_font(regular)
+                pdf.multi_cell(0, 10, '\n'.join(text_buffer))
+                text_buffer.clear()
+        
+        for kind, payload in _tokenize(resume_text):
+            if kind == 'text':
+                text_buffer.append(payload)
+                continue
+            flush_text()
+            if kind == 'heading':
+                level, text = payload
+                use_font(("Arial", "B", _PDF_HEADING_SIZES[level - 1]))
+                pdf.cell(0, 10, text, ln=True)
+            elif kind == 'bold':
+                use_font(("Arial", "B", 12))
+                pdf.cell(0, 10, payload, ln=True)
+            elif kind == 'bullet':
+                use_font(regular)
                 pdf.cell(10, 10, '•', ln=0)
-                pdf.cell(0, 10, line[1:].strip(), ln=True)
-            elif line.strip() == '':
-                # Empty line
+                pdf.cell(0, 10, payload, ln=True)
+            elif kind == 'blank':
                 pdf.ln(5)
-            elif '=' in line and len(line.strip()) > 10 and all(c == '=' for c in line.strip()):
-                # Separator line
+            else:  # separator
                 pdf.line(10, pdf.get_y(), 200, pdf.get_y())
                 pdf.ln(5)
-            else:
-                # Regular text
-                pdf.multi_cell(0, 10, line)
+        
+        flush_text()
         
         # Save PDF
         pdf.output(filename)
@@ -233,6 +369,37 @@ def save_as_pdf(resume_text, filename="resume.pdf"):
     except Exception as e:
         return f"Error saving PDF file: {str(e)}"
 
+def _docx_p(runs, style=None):
+    """Build one <w:p> element directly, bypassing python-docx's
+    per-paragraph style resolution
+
+    Args:
+        runs: List of (text, bold) tuples
+        style: Optional paragraph style id (e.g. 'ListBullet')
+        
+    Returns:
+        The oxml paragraph element
+    """
+    p = OxmlElement('w:p')
+    if style:
+        p_pr = OxmlElement('w:pPr')
+        p_style = OxmlElement('w:pStyle')
+        p_style.set(qn('w:val'), style)
+        p_pr.append(p_style)
+        p.append(p_pr)
+    for text, bold in runs:
+        r = OxmlElement('w:r')
+        if bold:
+            r_pr = OxmlElement('w:rPr')
+            r_pr.append(OxmlElement('w:b'))
+            r.append(r_pr)
+        t = OxmlElement('w:t')
+        t.set(qn('xml:space'), 'preserve')
+        t.text = text
+        r.append(t)
+        p.append(r)
+    return p
+
 def save_as_docx(resume_text, filename="resume.docx"):
     """
     Save resume as DOCX file
@@ -247,44 +414,54 @@ def save_as_docx(resume_text, filename="resume.docx"):
     if not DOCX_AVAILABLE:
         return f"Error: DOCX export requires python-docx package. Install with 'pip install python-docx'."
     
+    global OxmlElement, qn
+    if OxmlElement is None:
+        from docx.oxml import OxmlElement as _oxml_element
+        from docx.oxml.ns import qn as _qn
+        OxmlElement, qn = _oxml_element, _qn
+    
     try:
         # Create document object
+        import docx
         doc = docx.Document()
         
-        # Process markdown and add to document
-        lines = resume_text.split('\n')
-        for line in lines:
-            # Check for heading patterns
-            if line.startswith('# '):
-                doc.add_heading(line[2:], level=1)
-            elif line.startswith('## '):
-                doc.add_heading(line[3:], level=2)
-            elif line.startswith('### '):
-                doc.add_heading(line[4:], level=3)
-            elif line.startswith('-') or line.startswith('*'):
-                # Add bullet point
-                doc.add_paragraph(line[1:].strip(), style='ListBullet')
-            elif line.strip() == '':
+        # Render the shared token stream. Headings and the first
+        # bullet go through the high-level API so their styles get
+        # instantiated in styles.xml; everything else is built as raw
+        # oxml and spliced in before the section properties.
+        sect_pr = doc.element.body.xpath('./w:sectPr')[0]
+        bullet_style_primed = False
+        for kind, payload in _tokenize(resume_text):
+            if kind == 'heading':
+                level, text = payload
+                doc.add_heading(text, level=level)
+            elif kind == 'bold':
+                sect_pr.addprevious(_docx_p([(payload, True)]))
+            elif kind == 'bullet':
+                if bullet_style_primed:
+                    sect_pr.addprevious(
+                        _docx_p([(payload, False)], style='ListBullet'))
+                else:
+                    doc.add_paragraph(payload, style='ListBullet')
+                    bullet_style_primed = True
+            elif kind == 'blank':
                 # Empty line - skip
                 continue
-            elif '=' in line and len(line.strip()) > 10 and all(c == '=' for c in line.strip()):
-                # Separator - add horizontal line
-                doc.add_paragraph().add_run('_' * 50)
-            elif '**' in line:
-                # Process bold text
-                p = doc.add_paragraph()
-                # Split by bold markers
-                parts = re.split(r'(\*\*.*?\*\*)', line)
-                for part in parts:
-                    if part.startswith('**') and part.endswith('**'):
-                        # Bold text
-                        p.add_run(part[2:-2]).bold = True
-                    else:
-                        # Regular text
-                        p.add_run(part)
+            elif kind == 'separator':
+                # Add horizontal line
+                sect_pr.addprevious(_docx_p([('_' * 50, False)]))
+            elif '**' in payload:
+                # Process inline bold text
+                runs = [
+                    (part[2:-2], True)
+                    if part.startswith('**') and part.endswith('**')
+                    else (part, False)
+                    for part in _BOLD_SPLIT_RE.split(payload) if part
+                ]
+                sect_pr.addprevious(_docx_p(runs))
             else:
                 # Regular paragraph
-                doc.add_paragraph(line)
+                sect_pr.addprevious(_docx_p([(payload, False)]))
         
         # Save document
         doc.save(filename)
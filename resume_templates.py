@@ -3,6 +3,13 @@ Resume Templates Module for Resume Generator
 Provides different templates for formatting resumes
 """
 
+import functools
+import re
+import string
+
+# Comma separators (with surrounding whitespace) in a skills string
+_SKILLS_SPLIT = re.compile(r'\s*,\s*')
+
 # Modern template with clean markdown formatting
 MODERN_TEMPLATE = """
 # {name}
@@ -105,6 +112,61 @@ DARK_TEMPLATE = """
 {links}
 """
 
+# Name -> template lookup shared by every call
+_TEMPLATES = {
+    "modern": MODERN_TEMPLATE,
+    "classic": CLASSIC_TEMPLATE,
+    "minimalist": MINIMALIST_TEMPLATE,
+    "dark": DARK_TEMPLATE
+}
+
+# Field defaults copied into each format_resume call
+_TEMPLATE_DEFAULTS = {
+    'name': '',
+    'job_role': '',
+    'summary': '',
+    'skills': '',
+    'experience': '',
+    'education': '',
+    'email': '',
+    'phone': '',
+    'location': '',
+    'links': ''
+}
+_ALLOWED_FIELDS = frozenset(_TEMPLATE_DEFAULTS)
+
+@functools.lru_cache(maxsize=16)
+def _compile_template(name, template):
+    """
+    Compile a {field}-style template into a plain function.
+
+    Parsed exactly once at import; the generated function is a straight
+    tuple-of-strings join with no format-string parsing per call. Extra
+    keyword arguments are accepted and ignored so every compiled
+    template can be called with the full defaults dict.
+    """
+    parts = []
+    fields = []
+    for literal, field, _spec, _conv in string.Formatter().parse(template):
+        if literal:
+            parts.append(repr(literal))
+        if field is not None:
+            parts.append(field)
+            if field not in fields:
+                fields.append(field)
+    source = "def _fmt_{0}({1}, **_extra):\n    return ''.join(({2},))".format(
+        name, ", ".join(fields), ", ".join(parts))
+    namespace = {}
+    exec(compile(source, f"<template:{name}>", "exec"), namespace)
+    return namespace[f"_fmt_{name}"]
+
+# Each template compiled once at import into a direct-concatenation
+# function; filling one is a single join over its argument values
+_COMPILED_TEMPLATES = {
+    name: _compile_template(name, template)
+    for name, template in _TEMPLATES.items()
+}
+
 def get_template(template_name="modern", dark_mode=False):
     """
     Get the specified template
@@ -116,18 +178,11 @@ def get_template(template_name="modern", dark_mode=False):
     Returns:
         str: Template string
     """
-    if dark_mode and template_name.lower() != "dark":
+    if dark_mode:
         # Use dark template if dark mode is enabled
         return DARK_TEMPLATE
     
-    templates = {
-        "modern": MODERN_TEMPLATE,
-        "classic": CLASSIC_TEMPLATE,
-        "minimalist": MINIMALIST_TEMPLATE,
-        "dark": DARK_TEMPLATE
-    }
-    
-    return templates.get(template_name.lower(), MODERN_TEMPLATE)
+    return _TEMPLATES.get(template_name.lower(), MODERN_TEMPLATE)
 
 def format_resume(template_name, **kwargs):
     """
@@ -143,30 +198,22 @@ def format_resume(template_name, **kwargs):
     dark_mode = kwargs.pop('dark_mode', False)
     template = get_template(template_name, dark_mode)
     
-    # Ensure all required fields are available
-    defaults = {
-        'name': '',
-        'job_role': '',
-        'summary': '',
-        'skills': '',
-        'experience': '',
-        'education': '',
-        'email': '',
-        'phone': '',
-        'location': '',
-        'links': ''
+    # Ensure all required fields are available; one C-level dict merge
+    defaults = _TEMPLATE_DEFAULTS | {
+        key: value for key, value in kwargs.items() if key in _ALLOWED_FIELDS
     }
     
-    # Update defaults with provided values
-    for key, value in kwargs.items():
-        if key in defaults:
-            defaults[key] = value
-    
-    # Format skills as bullet points if they're comma-separated
-    if ',' in defaults['skills']:
-        skills_list = [skill.strip() for skill in defaults['skills'].split(',')]
-        formatted_skills = '\n'.join([f"- {skill}" for skill in skills_list])
-        defaults['skills'] = formatted_skills
+    # Format skills as bullet points if they're comma-separated; one
+    # C-level substitution instead of split/strip/join
+    skills = defaults['skills']
+    if ',' in skills:
+        defaults['skills'] = '- ' + _SKILLS_SPLIT.sub('\n- ', skills.strip())
     
-    # Format the resume
-    return template.format(**defaults) 
\ No newline at end of file
+    # Format the resume with the precompiled filler for this template
+    if dark_mode:
+        key = "dark"
+    else:
+        key = template_name.lower()
+        if key not in _COMPILED_TEMPLATES:
+            key = "modern"
+    return _COMPILED_TEMPLATES[key](**defaults) 
\ No newline at end of file
@@ -6,9 +6,13 @@ Provides spelling, grammar checking, and text improvement tools
 import re
 import json
 import os
+import atexit
+import hashlib
 import random
 import string
 import requests
+import functools
+from collections import Counter
 
 # Try to import optional dependencies
 try:
@@ -17,9 +21,21 @@ try:
 except ImportError:
     LANGUAGE_TOOL_AVAILABLE = False
 
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 # Ollama API URL for AI-powered enhancement
 OLLAMA_API_URL = "http://localhost:11434/api/generate"
 
+# One keep-alive session shared by every Ollama call; repeated requests
+# reuse the pooled TCP connection instead of reconnecting each time
+_HTTP = requests.Session()
+_HTTP.mount("http://", requests.adapters.HTTPAdapter(pool_connections=2,
+                                                     pool_maxsize=4))
+
 # Common spelling mistakes dictionary
 COMMON_SPELLING_MISTAKES = {
     "accomodate": "accommodate",
@@ -198,6 +214,95 @@ ACTION_VERBS = {
     ]
 }
 
+# Patterns compiled once at import; every checker call reuses the
+# bound methods instead of re-interpolating pattern strings.
+# Spell checking tokenizes words and looks each one up in the mistake
+# dictionary, so one scan handles any number of known misspellings.
+# Clean text (the common case) bails out on a cheap literal prefilter
+# before the per-token pass runs.
+_WORD_RE = re.compile(r"\b[A-Za-z']+\b")
+_SPELL_PREFILTER = re.compile(
+    '|'.join(COMMON_SPELLING_MISTAKES), re.IGNORECASE
+)
+
+# Stopwords filtered out of job descriptions during keyword extraction
+COMMON_WORDS = frozenset({
+    "a", "an", "the", "and", "or", "but", "is", "are", "was", "were", "be", "been",
+    "being", "in", "on", "at", "by", "for", "with", "about", "against", "between",
+    "into", "through", "during", "before", "after", "above", "below", "to", "from",
+    "up", "down", "of", "off", "over", "under", "again", "further", "then", "once",
+    "here", "there", "when", "where", "why", "how", "all", "any", "both", "each",
+    "few", "more", "most", "other", "some", "such", "no", "nor", "not", "only",
+    "own", "same", "so", "than", "too", "very", "s", "t", "can", "will", "just",
+    "don", "should", "now", "you", "we", "our", "company", "position", "job", "role",
+    "candidate", "applicant", "ideal", "looking", "must", "required", "preferred",
+    "responsibilities", "qualifications", "requirements", "ability", "experience",
+    "work", "working", "team", "strong", "excellent", "include", "including"
+})
+
+# Word tokens in a job description, including tech terms like c++ or c#
+_TOKEN_RE = re.compile(r'\b[a-zA-Z][a-zA-Z+#.]*\b')
+
+# The other word lists get the same treatment: one alternation per
+# category, longest entries first so multi-word phrases win, scanned in
+# a single linear sweep instead of one pass per pattern
+_WEAK_UNION = re.compile(
+    r'\b(' + '|'.join(
+        re.escape(w) for w in sorted(WEAK_WORDS, key=len, reverse=True)
+    ) + r')\b',
+    re.IGNORECASE
+)
+
+# Matched against lowercased text, so no IGNORECASE folding per char
+_CLICHE_UNION = re.compile(
+    '|'.join(
+        re.escape(c) for c in sorted(set(RESUME_CLICHES), key=len, reverse=True)
+    )
+)
+
+_ATS_SECTIONS = ("experience", "education", "skills", "summary",
+                 "objective", "work", "contact")
+
+# Everything the ATS format check looks for, fused into one pattern so
+# a single sweep of the resume tallies sections, bullets and the email
+# marker together
+# Matched against lowercased text, so no IGNORECASE folding per char
+_ATS_UNION = re.compile(
+    r'\b(?P<section>' + '|'.join(_ATS_SECTIONS) + r')\b'
+    r'|(?P<bullet>[•\-*])'
+    r'|(?P<at>@)'
+)
+
+# Flat lowercased views of the categorized verb lists; membership tests
+# become one set lookup instead of a scan over every category
+_ALL_ACTION_VERBS_LOWER = frozenset(
+    verb.lower() for verbs in ACTION_VERBS.values() for verb in verbs
+)
+_ALL_POWER_WORDS_LOWER = frozenset(
+    word.lower() for words in RESUME_POWER_WORDS.values() for word in words
+)
+# Inverted index for suggesting a verb category: maps each lowercase
+# verb to the first category listing it, so scoring a bullet is one
+# pass over its tokens instead of a scan of every category
+_VERB_TO_CATEGORY = {}
+for _category, _verbs in ACTION_VERBS.items():
+    for _verb in _verbs:
+        _VERB_TO_CATEGORY.setdefault(_verb.lower(), _category)
+del _category, _verbs, _verb
+
+# LanguageTool is backed by a JVM subprocess whose startup dominates any
+# single check, so one instance is created lazily and shared by every
+# check_grammar call for the life of the process
+_LT_TOOL = None
+
+def _get_lt():
+    """Return the shared LanguageTool instance, starting it on first use"""
+    global _LT_TOOL
+    if _LT_TOOL is None:
+        _LT_TOOL = language_tool_python.LanguageTool('en-US')
+        atexit.register(_LT_TOOL.close)
+    return _LT_TOOL
+
 def check_spelling(text):
     """
     Check text for spelling errors using a dictionary of common mistakes
@@ -208,29 +313,25 @@ def check_spelling(text):
     Returns:
         tuple: (corrected_text, list of corrections made)
     """
+    # Most text contains no known typo; one literal scan settles that
+    # without paying the per-token replacement pass
+    if _SPELL_PREFILTER.search(text) is None:
+        return text, []
+    
     corrections = []
-    corrected_text = text
-    
-    # Check for each common spelling mistake
-    for mistake, correction in COMMON_SPELLING_MISTAKES.items():
-        # Create a regex that matches the mistake as a whole word
-        pattern = r'\b' + mistake + r'\b'
-        if re.search(pattern, corrected_text, re.IGNORECASE):
-            # Find all instances of the mistake
-            matches = re.finditer(pattern, corrected_text, re.IGNORECASE)
-            for match in matches:
-                # Get the exact matched text to preserve case
-                matched_text = match.group(0)
-                if matched_text[0].isupper():
-                    replacement = correction.capitalize()
-                else:
-                    replacement = correction
-                
-                # Add to list of corrections
-                corrections.append((matched_text, replacement))
-            
-            # Replace all instances of the mistake
-            corrected_text = re.sub(pattern, correction, corrected_text, flags=re.IGNORECASE)
+    
+    def _replace(match):
+        # Get the exact matched text to preserve case
+        matched_text = match.group(0)
+        replacement = COMMON_SPELLING_MISTAKES.get(matched_text.lower())
+        if replacement is None:
+            return matched_text
+        if matched_text[0].isupper():
+            replacement = replacement.capitalize()
+        corrections.append((matched_text, replacement))
+        return replacement
+    
+    corrected_text = _WORD_RE.sub(_replace, text)
     
     return corrected_text, corrections
 
@@ -248,29 +349,35 @@ def check_grammar(text):
         return text, ["Grammar checking requires the language_tool_python package. Install with 'pip install language-tool-python'."]
     
     try:
-        # Initialize LanguageTool
-        tool = language_tool_python.LanguageTool('en-US')
+        # Shared LanguageTool instance; only the first call pays startup
+        tool = _get_lt()
         
         # Get grammar mistakes
         matches = tool.check(text)
         
         corrections = []
-        corrected_text = text
+        parts = []
+        pos = 0
         
-        # Apply suggestions
-        for match in matches:
-            if match.replacements:
-                correction = (
-                    match.context[match.offset:match.offset + match.errorLength],
-                    match.replacements[0]
-                )
-                corrections.append(correction)
-                
-                # Replace in text
-                corrected_text = corrected_text[:match.offset] + match.replacements[0] + corrected_text[match.offset + match.errorLength:]
+        # Apply suggestions in one rebuild: offsets refer to the
+        # original text, so batching keeps them valid when replacements
+        # change the length and avoids re-copying the string per match
+        for match in sorted(matches, key=lambda m: m.offset):
+            if not match.replacements or match.offset < pos:
+                continue
+            correction = (
+                match.context[match.offset:match.offset + match.errorLength],
+                match.replacements[0]
+            )
+            corrections.append(correction)
+            
+            # Copy the untouched stretch, then the replacement
+            parts.append(text[pos:match.offset])
+            parts.append(match.replacements[0])
+            pos = match.offset + match.errorLength
+        parts.append(text[pos:])
         
-        tool.close()
-        return corrected_text, corrections
+        return ''.join(parts), corrections
     
     except Exception as e:
         return text, [f"Grammar check error: {str(e)}"]
@@ -288,52 +395,61 @@ def enhance_text(text):
     enhancements = []
     enhanced_text = text
     
-    # Replace weak words
-    for weak_word in WEAK_WORDS:
-        pattern = r'\b' + weak_word + r'\b'
-        if re.search(pattern, enhanced_text, re.IGNORECASE):
-            # Just remove the weak word rather than replace it
-            enhanced_text = re.sub(pattern, '', enhanced_text, flags=re.IGNORECASE)
-            enhancements.append((weak_word, "(removed)"))
-    
-    # Replace clichés with more specific language
+    # Find and remove weak words; one sweep locates them all, one
+    # substitution removes them
+    found_weak = {m.group(0).lower() for m in _WEAK_UNION.finditer(enhanced_text)}
+    if found_weak:
+        # Just remove the weak words rather than replace them
+        enhanced_text = _WEAK_UNION.sub('', enhanced_text)
+        for weak_word in WEAK_WORDS:
+            if weak_word in found_weak:
+                enhancements.append((weak_word, "(removed)"))
+    
+    # Flag clichés found in the same single-sweep fashion; lowercase
+    # the text once rather than case-folding inside the regex engine
+    found_cliches = set(_CLICHE_UNION.findall(enhanced_text.lower()))
     for cliche in RESUME_CLICHES:
-        if cliche in enhanced_text.lower():
+        if cliche in found_cliches:
             # Suggest removing the cliché
             enhancements.append((cliche, "Consider replacing with more specific achievements"))
     
     # Ensure every bullet point starts with an action verb
-    lines = enhanced_text.split('\n')
-    for i, line in enumerate(lines):
-        # Check if line is a bullet point
-        if line.strip().startswith('•') or line.strip().startswith('-') or line.strip().startswith('*'):
-            content = line.strip()[1:].strip()
-            words = content.split()
+    for line in enhanced_text.split('\n'):
+        # Check if line is a bullet point; strip each line only once
+        stripped = line.strip()
+        if not stripped or stripped[0] not in '•-*':
+            continue
+        content = stripped[1:].strip()
+        words = content.split()
+        
+        # If the line has content and doesn't start with an action verb
+        if words and words[0].lower().rstrip(',.:;') not in _ALL_ACTION_VERBS_LOWER:
+            # Suggest an action verb based on context
+            suggested_category = 'management'  # Default category
             
-            # If the line has content and doesn't start with an action verb
-            if words and not any(verb.lower() == words[0].lower().rstrip(',.:;') for category in ACTION_VERBS.values() for verb in category):
-                # Suggest an action verb based on context
-                suggested_category = 'management'  # Default category
-                
-                # Try to determine the most relevant category based on the content
-                category_scores = {}
-                for category, verbs in ACTION_VERBS.items():
-                    score = 0
-                    for verb in verbs:
-                        if verb.lower() in content.lower():
-                            score += 1
-                    category_scores[category] = score
-                
-                if category_scores:
-                    suggested_category = max(category_scores.items(), key=lambda x: x[1])[0]
-                
-                # Suggest a random verb from the category
-                suggested_verb = random.choice(ACTION_VERBS[suggested_category])
-                
-                enhancements.append((f"Bullet point: {content}", f"Consider starting with an action verb like '{suggested_verb}'"))
+            # Try to determine the most relevant category based on the
+            # content: one pass over its tokens through the inverted index
+            category_scores = Counter(
+                _VERB_TO_CATEGORY[token]
+                for word in words
+                if (token := word.lower().rstrip(',.:;')) in _VERB_TO_CATEGORY
+            )
+            
+            if category_scores:
+                suggested_category = category_scores.most_common(1)[0][0]
+            
+            # Suggest a random verb from the category
+            suggested_verb = random.choice(ACTION_VERBS[suggested_category])
+            
+            enhancements.append((f"Bullet point: {content}", f"Consider starting with an action verb like '{suggested_verb}'"))
     
     return enhanced_text, enhancements
 
+# Successful AI enhancements keyed by content hash; retrying the same
+# text (a common edit-and-retry pattern) skips the model entirely
+_AI_CACHE = {}
+_AI_CACHE_MAX = 256
+
 def enhance_with_ai(text, job_role):
     """
     Enhance text using Ollama API if available
@@ -345,55 +461,78 @@ def enhance_with_ai(text, job_role):
     Returns:
         tuple: (enhanced_text, explanation)
     """
+    cache_key = (
+        hashlib.blake2b(text.encode(), digest_size=16).digest(), job_role
+    )
+    cached = _AI_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
+        # One prompt produces both the rewrite and the explanation, so a
+        # single model pass replaces the old pair of requests
         payload = {
             "model": "qwen2.5:3b",
             "prompt": f"""Improve the following resume content for a {job_role} position. 
 Make it more impactful, professional, and results-oriented. 
 Replace weak phrases with strong action verbs, add metrics where sensible, and ensure it's ATS-friendly.
 Do not invent false information. Keep the same general content but improve the phrasing.
+After the improved content, write a line reading exactly "KEY IMPROVEMENTS:" followed by 3-5 key improvements made.
 
 CONTENT TO IMPROVE:
 {text}
 
 IMPROVED CONTENT:""",
-            "stream": False
+            "stream": True
         }
         
-        response = requests.post(OLLAMA_API_URL, json=payload, timeout=10)
+        response = _HTTP.post(OLLAMA_API_URL, json=payload, timeout=10,
+                              stream=True)
         
         if response.status_code == 200:
-            data = response.json()
-            enhanced_text = data.get("response", "")
-            
-            # Generate an explanation of changes
-            explanation_prompt = f"""Briefly explain the key improvements made to this resume content:
-Original: {text}
-Improved: {enhanced_text}
-
-List 3-5 key improvements made:"""
-            
-            explanation_payload = {
-                "model": "qwen2.5:3b",
-                "prompt": explanation_prompt,
-                "stream": False
-            }
-            
-            explanation_response = requests.post(OLLAMA_API_URL, json=explanation_payload, timeout=10)
+            # Read the stream incrementally; each chunk resets the socket
+            # timeout, so long generations are not cut off mid-decode
+            chunks = []
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                chunks.append(data.get("response", ""))
+                if data.get("done"):
+                    break
+            full_text = "".join(chunks)
             
-            if explanation_response.status_code == 200:
-                explanation_data = explanation_response.json()
-                explanation = explanation_data.get("response", "Text enhanced with stronger language and clarity.")
+            # Split the combined response into content and explanation
+            enhanced_text, marker, explanation = full_text.partition(
+                "KEY IMPROVEMENTS:")
+            if marker:
+                explanation = explanation.strip()
             else:
                 explanation = "Text enhanced with stronger language and clarity."
             
-            return enhanced_text, explanation
+            # Only successful generations are cached; errors retry
+            if len(_AI_CACHE) >= _AI_CACHE_MAX:
+                _AI_CACHE.pop(next(iter(_AI_CACHE)))
+            result = (enhanced_text.strip(), explanation)
+            _AI_CACHE[cache_key] = result
+            return result
         
         return text, "Could not connect to Ollama API."
     
     except Exception as e:
         return text, f"Error using AI enhancement: {str(e)}"
 
+@functools.lru_cache(maxsize=32)
+def _keyword_scanner(keywords_tuple):
+    """Compile the keyword union once per distinct keyword set; scoring
+    a batch of resumes against one job reuses the compiled pattern"""
+    pattern = r'\b(' + '|'.join(re.escape(k) for k in keywords_tuple) + r')\b'
+    if RE2_AVAILABLE:
+        # RE2's DFA stays linear even on huge alternations, where the
+        # backtracking stdlib engine slows down
+        return re2.compile(pattern)
+    return re.compile(pattern)
+
 def calculate_ats_score(text, job_keywords=None):
     """
     Calculate an ATS compatibility score for resume text
@@ -413,6 +552,10 @@ def calculate_ats_score(text, job_keywords=None):
         "suggestions": []
     }
     
+    # Lowercase the text once; every case-insensitive check below runs
+    # against this copy instead of folding case per character
+    text_lower = text.lower()
+    
     # Check length (between 400-800 words is ideal)
     words = text.split()
     word_count = len(words)
@@ -429,36 +572,48 @@ def calculate_ats_score(text, job_keywords=None):
     # Check formatting
     format_score = 100
     
+    # One sweep tallies the email marker, section headers and bullets
+    has_email = False
+    found_sections = set()
+    bullets = 0
+    for match in _ATS_UNION.finditer(text_lower):
+        kind = match.lastgroup
+        if kind == "section":
+            found_sections.add(match.group("section"))
+        elif kind == "bullet":
+            bullets += 1
+        else:
+            has_email = True
+    
     # Check for common format issues
-    if text.count('@') == 0:
+    if not has_email:
         format_score -= 10
         score["suggestions"].append("No email address detected.")
     
     # Check for section headers
-    sections = ["experience", "education", "skills", "summary", "objective", "work", "contact"]
-    found_sections = 0
-    for section in sections:
-        if re.search(r'\b' + section + r'\b', text, re.IGNORECASE):
-            found_sections += 1
-    
-    if found_sections < 3:
+    if len(found_sections) < 3:
         format_score -= 20
         score["suggestions"].append("Not enough clear section headers detected. Include clear sections for Experience, Education, Skills, etc.")
     
     # Check for bullet points
-    bullets = len(re.findall(r'•|-|\*', text))
     if bullets < 5:
         format_score -= 10
         score["suggestions"].append("Not enough bullet points. Use bullets to highlight achievements and responsibilities.")
     
     score["format"] = max(0, format_score)
     
-    # Check keyword match if job keywords provided
+    # Check keyword match if job keywords provided; one union pattern
+    # finds every keyword in a single scan of the text
     if job_keywords:
-        matched_keywords = 0
-        for keyword in job_keywords:
-            if re.search(r'\b' + re.escape(keyword) + r'\b', text, re.IGNORECASE):
-                matched_keywords += 1
+        keyword_union = _keyword_scanner(
+            tuple(sorted({k.lower() for k in job_keywords}))
+        )
+        found_keywords = {
+            m.group(0) for m in keyword_union.finditer(text_lower)
+        }
+        matched_keywords = sum(
+            1 for keyword in job_keywords if keyword.lower() in found_keywords
+        )
         
         keyword_score = int((matched_keywords / len(job_keywords)) * 100) if job_keywords else 0
         score["keyword_match"] = keyword_score
@@ -508,7 +663,7 @@ KEYWORDS:""",
             "stream": False
         }
         
-        response = requests.post(OLLAMA_API_URL, json=payload, timeout=10)
+        response = _HTTP.post(OLLAMA_API_URL, json=payload, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
@@ -524,48 +679,23 @@ KEYWORDS:""",
         pass
     
     # Fallback to simple extraction
-    # Remove common words, focus on nouns, technical terms, etc.
-    common_words = set([
-        "a", "an", "the", "and", "or", "but", "is", "are", "was", "were", "be", "been", 
-        "being", "in", "on", "at", "by", "for", "with", "about", "against", "between", 
-        "into", "through", "during", "before", "after", "above", "below", "to", "from", 
-        "up", "down", "of", "off", "over", "under", "again", "further", "then", "once", 
-        "here", "there", "when", "where", "why", "how", "all", "any", "both", "each", 
-        "few", "more", "most", "other", "some", "such", "no", "nor", "not", "only", 
-        "own", "same", "so", "than", "too", "very", "s", "t", "can", "will", "just", 
-        "don", "should", "now", "you", "we", "our", "company", "position", "job", "role",
-        "candidate", "applicant", "ideal", "looking", "must", "required", "preferred",
-        "responsibilities", "qualifications", "requirements", "ability", "experience",
-        "work", "working", "team", "strong", "excellent", "include", "including"
-    ])
-    
-    # Tokenize and filter
-    words = re.findall(r'\b[a-zA-Z][a-zA-Z+#.]*\b', job_description.lower())
-    potential_keywords = [word for word in words if word not in common_words and len(word) > 2]
+    # Tokenize and filter out common words
+    words = _TOKEN_RE.findall(job_description.lower())
+    potential_keywords = [word for word in words if word not in COMMON_WORDS and len(word) > 2]
     
     # Count word frequency
-    word_counts = {}
-    for word in potential_keywords:
-        if word in word_counts:
-            word_counts[word] += 1
-        else:
-            word_counts[word] = 1
+    word_counts = Counter(potential_keywords)
     
     # Extract multiword terms (e.g., "machine learning")
-    word_pairs = []
     words = job_description.lower().split()
-    for i in range(len(words) - 1):
-        if words[i] not in common_words and words[i+1] not in common_words:
-            word_pair = f"{words[i]} {words[i+1]}"
-            word_pairs.append(word_pair)
-    
-    # Count pair frequency
-    for pair in word_pairs:
-        if pair in word_counts:
-            word_counts[pair] += 3  # Give higher weight to multi-word terms
-        else:
-            word_counts[pair] = 3
+    word_pairs = [
+        f"{a} {b}" for a, b in zip(words, words[1:])
+        if a not in COMMON_WORDS and b not in COMMON_WORDS
+    ]
+    
+    # Count pair frequency; multi-word terms get higher weight
+    word_counts.update({pair: 3 * count
+                        for pair, count in Counter(word_pairs).items()})
     
-    # Sort by frequency and return top keywords
-    sorted_keywords = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
-    return [keyword for keyword, count in sorted_keywords[:20]] 
\ No newline at end of file
+    # Return the top keywords by frequency
+    return [keyword for keyword, count in word_counts.most_common(20)] 
\ No newline at end of file